@@ -109,7 +109,8 @@ function BurndownChart({ data }) {
   const W = 520, H = 220, P = { t: 12, r: 20, b: 40, l: 44 };
   const cw = W - P.l - P.r, ch = H - P.t - P.b;
 
-  const ideal = data.ideal_burndown || [];
+  const bd    = data.ideal_burndown || {};
+  const ideal = (bd.dates || []).map((date, i) => ({ date, ideal: bd.ideal[i] }));
   if (!ideal.length) return <Empty msg="No items in sprint yet" />;
 
   const today    = new Date().toISOString().split('T')[0];
@@ -196,7 +197,8 @@ function BurndownChart({ data }) {
 function BurnupChart({ data }) {
   const [tt, setTt] = useState(null);
   const ref = useRef(null);
-  const pts = data.burnup || [];
+  const bu  = data.burnup || {};
+  const pts = (bu.dates || []).map((date, i) => ({ date, target: bu.target[i], scope: data.total_points }));
   if (!pts.length) return <Empty msg="No burnup data" />;
   const W = 520, H = 220, P = { t: 12, r: 20, b: 40, l: 44 };
   const cw = W - P.l - P.r, ch = H - P.t - P.b;
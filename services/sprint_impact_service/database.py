@@ -1,8 +1,10 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import ASCENDING, DESCENDING
 from bson import ObjectId
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime
 import os
+import numpy as np
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,19 +12,39 @@ load_dotenv()
 MONGODB_URI = os.getenv("MONGODB_URI")
 DATABASE_NAME = "agile-tool"
 
+# Wire compression (server picks the first it supports; zstd needs MongoDB ≥ 4.2
+# and the zstandard package) and a pool sized for the gather() fan-outs below.
+# The pool sizes are totals for the deployment: each server worker process
+# (WEB_CONCURRENCY, exported by main.py) opens an equal share of them.
+MONGODB_COMPRESSORS = os.getenv("MONGODB_COMPRESSORS", "zstd,zlib")
+_WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+MONGODB_MAX_POOL_SIZE = max(1, int(os.getenv("MONGODB_MAX_POOL_SIZE", "200")) // _WORKERS)
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "20")) // _WORKERS
+
 client = None
 database = None
 
 async def connect_db():
     global client, database
-    client = AsyncIOMotorClient(MONGODB_URI)
+    client = AsyncIOMotorClient(
+        MONGODB_URI,
+        compressors=MONGODB_COMPRESSORS,
+        maxPoolSize=MONGODB_MAX_POOL_SIZE,
+        minPoolSize=MONGODB_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=2000,
+    )
     database = client[DATABASE_NAME]
     
     # Create indexes
     await database.spaces.create_index([("created_at", DESCENDING)])
     await database.sprints.create_index([("space_id", ASCENDING)])
+    # Covers the completed-sprint $match + $sort + $limit used by velocity history
+    await database.sprints.create_index(
+        [("space_id", ASCENDING), ("status", ASCENDING), ("updated_at", DESCENDING)]
+    )
     await database.backlog_items.create_index([("space_id", ASCENDING)])
-    await database.backlog_items.create_index([("sprint_id", ASCENDING)])
+    # Prefix also serves sprint_id-only queries, so no separate sprint_id index
+    await database.backlog_items.create_index([("sprint_id", ASCENDING), ("status", ASCENDING)])
     
     print("Connected to MongoDB")
 
@@ -38,23 +60,24 @@ def get_database():
 
 # ── Helper functions ──────────────────────────────────────────────────────────
 
-def _sprint_helper(sprint) -> dict:
-    def format_date(date_obj):
-        if not date_obj:
-            return None
-        if isinstance(date_obj, str):
-            return date_obj
-        if isinstance(date_obj, datetime):
-            return date_obj.strftime('%Y-%m-%d')
+def _format_date(date_obj):
+    if not date_obj:
         return None
-    
+    if isinstance(date_obj, str):
+        return date_obj
+    if isinstance(date_obj, datetime):
+        return date_obj.date().isoformat()   # 'YYYY-MM-DD'
+    return None
+
+
+def _sprint_helper(sprint) -> dict:
     return {
         "id": str(sprint["_id"]),
         "name": sprint["name"],
         "goal": sprint.get("goal", ""),
         "duration_type": sprint.get("duration_type", "2 Weeks"),
-        "start_date": format_date(sprint.get("start_date")),
-        "end_date": format_date(sprint.get("end_date")),
+        "start_date": _format_date(sprint.get("start_date")),
+        "end_date": _format_date(sprint.get("end_date")),
         "space_id": sprint["space_id"],
         "status": sprint["status"],
         "assignees": sprint.get("assignees", []),
@@ -62,6 +85,16 @@ def _sprint_helper(sprint) -> dict:
         "updated_at": sprint["updated_at"],
     }
 
+# Only the fields _backlog_helper reads (_id is always returned)
+_BACKLOG_PROJECTION = {
+    "title": 1, "description": 1, "type": 1, "priority": 1,
+    "story_points": 1, "status": 1, "space_id": 1, "sprint_id": 1,
+    "created_at": 1, "updated_at": 1,
+}
+
+# Documents per getMore round-trip when draining cursors with to_list()
+_CURSOR_BATCH = 500
+
 def _backlog_helper(item) -> dict:
     return {
         "id": str(item["_id"]),
@@ -78,26 +111,99 @@ def _backlog_helper(item) -> dict:
     }
 
 
+# ── Request batching ──────────────────────────────────────────────────────────
+
+class _BatchLoader:
+    """
+    Coalesce lookups issued within the same event-loop tick into one query.
+
+    Concurrent callers each get their own future; the first `load()` of a
+    tick schedules a flush with `call_soon`, so every other `load()` made
+    before control returns to the loop joins the same `$in` round-trip.
+    `batch_fn(keys)` returns a dict keyed like the inputs; missing keys
+    resolve to None.
+    """
+
+    def __init__(self, batch_fn):
+        self._batch_fn = batch_fn
+        self._pending: dict = {}
+        self._tasks: set = set()
+
+    def load(self, key):
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._dispatch, loop)
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        return future
+
+    def _dispatch(self, loop):
+        pending, self._pending = self._pending, {}
+        task = loop.create_task(self._flush(pending))
+        # Keep a strong reference until the flush finishes
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, pending: dict):
+        try:
+            results = await self._batch_fn(list(pending))
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        for key, futures in pending.items():
+            value = results.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
+
+
+async def _load_sprints(sprint_ids: list) -> dict:
+    db = get_database()
+    docs = await db.sprints.find(
+        {"_id": {"$in": [ObjectId(sid) for sid in sprint_ids]}}
+    ).to_list(length=None)
+    return {str(doc["_id"]): _sprint_helper(doc) for doc in docs}
+
+
+async def _load_backlog_items_by_sprint(sprint_ids: list) -> dict:
+    db = get_database()
+    grouped = {sid: [] for sid in sprint_ids}
+    docs = await (
+        db.backlog_items.find({"sprint_id": {"$in": sprint_ids}}, projection=_BACKLOG_PROJECTION)
+        .sort("created_at", -1)
+        .batch_size(_CURSOR_BATCH)
+        .to_list(length=None)
+    )
+    for item in docs:
+        grouped[item["sprint_id"]].append(_backlog_helper(item))
+    return grouped
+
+
+sprint_loader = _BatchLoader(_load_sprints)
+backlog_by_sprint_loader = _BatchLoader(_load_backlog_items_by_sprint)
+
+
 # ── Sprint helpers ────────────────────────────────────────────────────────────
 
 async def get_sprint_by_id(sprint_id: str) -> dict | None:
     """Fetch a single sprint by its string ID. Returns None if not found."""
-    db = get_database()
     if not ObjectId.is_valid(sprint_id):
         return None
-    sprint = await db.sprints.find_one({"_id": ObjectId(sprint_id)})
+    # Normalise so the key matches str(doc["_id"]) in the batch result
+    sprint = await sprint_loader.load(str(ObjectId(sprint_id)))
     if not sprint:
         return None
-    return _sprint_helper(sprint)
+    # Callers in the same batch may share a result; hand each its own copy
+    return dict(sprint)
 
 
 async def get_backlog_items_by_sprint(sprint_id: str) -> list:
     """Fetch all backlog items assigned to a sprint."""
-    db = get_database()
-    items = []
-    async for item in db.backlog_items.find({"sprint_id": sprint_id}).sort("created_at", -1):
-        items.append(_backlog_helper(item))
-    return items
+    items = await backlog_by_sprint_loader.load(sprint_id)
+    return list(items or [])
 
 
 async def get_completed_sprints(space_id: str, limit: int = 20) -> list:
@@ -107,28 +213,37 @@ async def get_completed_sprints(space_id: str, limit: int = 20) -> list:
     Returns list of dicts with: id, completed_sp, start_date, end_date
     """
     db = get_database()
-    completed_sprints = []
     
-    async for sprint in (
-        db.sprints.find({"space_id": space_id, "status": "Completed"})
+    sprints = await (
+        db.sprints.find(
+            {"space_id": space_id, "status": "Completed"},
+            projection={"start_date": 1, "end_date": 1},
+        )
         .sort("updated_at", DESCENDING)
         .limit(limit)
-    ):
-        sprint_id_str = str(sprint["_id"])
-        
-        # Calculate completed story points for this sprint
-        completed_sp = 0
-        async for item in db.backlog_items.find({"sprint_id": sprint_id_str, "status": "Done"}):
-            completed_sp += item.get("story_points", 0)
-        
-        completed_sprints.append({
+        .to_list(length=None)
+    )
+    sprint_ids = [str(sprint["_id"]) for sprint in sprints]
+
+    # Completed SP for every sprint in one server-side aggregation
+    done_by_sprint = {}
+    if sprint_ids:
+        pipeline = [
+            {"$match": {"sprint_id": {"$in": sprint_ids}, "status": "Done"}},
+            {"$group": {"_id": "$sprint_id", "done": {"$sum": "$story_points"}}},
+        ]
+        async for doc in db.backlog_items.aggregate(pipeline):
+            done_by_sprint[doc["_id"]] = doc["done"]
+    
+    return [
+        {
             "id": sprint_id_str,
-            "completed_sp": completed_sp,
+            "completed_sp": done_by_sprint.get(sprint_id_str, 0),
             "start_date": sprint.get("start_date"),
             "end_date": sprint.get("end_date"),
-        })
-    
-    return completed_sprints
+        }
+        for sprint, sprint_id_str in zip(sprints, sprint_ids)
+    ]
 
 
 async def get_last_completed_sprint(space_id: str) -> dict | None:
@@ -160,9 +275,9 @@ async def get_last_completed_sprint(space_id: str) -> dict | None:
     
     try:
         if isinstance(start, str):
-            start = datetime.strptime(start, '%Y-%m-%d')
+            start = datetime.fromisoformat(start)
         if isinstance(end, str):
-            end = datetime.strptime(end, '%Y-%m-%d')
+            end = datetime.fromisoformat(end)
         
         if start and end:
             sprint_duration_days = max(1, (end - start).days)
@@ -173,7 +288,11 @@ async def get_last_completed_sprint(space_id: str) -> dict | None:
     completed_story_points = 0
     assignee_set = set()
     
-    async for item in db.backlog_items.find({"sprint_id": sprint_id_str, "status": "Done"}):
+    items = await db.backlog_items.find(
+        {"sprint_id": sprint_id_str, "status": "Done"},
+        projection={"story_points": 1, "assignee_id": 1, "_id": 0},
+    ).batch_size(_CURSOR_BATCH).to_list(length=None)
+    for item in items:
         completed_story_points += item.get("story_points", 0)
         # Note: assignees might be stored differently; adjust based on your schema
         if "assignee_id" in item:
@@ -228,7 +347,11 @@ async def calculate_sprint_capacity(space_id: str, new_assignee_count: int, base
     total_committed_sp = 0
     completed_sp = 0
     
-    async for item in db.backlog_items.find({"sprint_id": previous_sprint_id}):
+    items = await db.backlog_items.find(
+        {"sprint_id": previous_sprint_id},
+        projection={"story_points": 1, "status": 1, "_id": 0},
+    ).batch_size(_CURSOR_BATCH).to_list(length=None)
+    for item in items:
         sp = item.get("story_points", 0)
         total_committed_sp += sp
         if item.get("status") == "Done":
@@ -283,7 +406,11 @@ async def check_sprint_capacity_status(sprint_id: str) -> dict:
     
     # Calculate current load from all items in sprint
     current_load_sp = 0
-    async for item in db.backlog_items.find({"sprint_id": sprint_id}):
+    items = await db.backlog_items.find(
+        {"sprint_id": sprint_id},
+        projection={"story_points": 1, "status": 1, "_id": 0},
+    ).batch_size(_CURSOR_BATCH).to_list(length=None)
+    for item in items:
         if item.get("status") != "Done":
             current_load_sp += item.get("story_points", 0)
     
@@ -320,29 +447,71 @@ async def get_space_velocity_history(space_id: str, limit: int = 10) -> list:
     db = get_database()
     velocity_history = []
 
-    async for sprint in (
-        db.sprints.find({"space_id": space_id, "status": "Completed"})
-        .sort("updated_at", DESCENDING)
-        .limit(limit)
-    ):
-        sprint_id_str = str(sprint["_id"])
-        done_points = 0
-        async for item in db.backlog_items.find(
-            {"sprint_id": sprint_id_str, "status": "Done"}
-        ):
-            done_points += item.get("story_points", 0)
-
+    # One round-trip: the Done-points sum for every sprint is computed
+    # server-side via $lookup instead of one find() per sprint.
+    pipeline = [
+        {"$match": {"space_id": space_id, "status": "Completed"}},
+        {"$sort": {"updated_at": DESCENDING}},
+        {"$limit": limit},
+        {"$sort": {"updated_at": ASCENDING}},    # chronological order for the chart
+        {"$lookup": {
+            "from": "backlog_items",
+            "let": {"sid": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$sprint_id", "$$sid"]},
+                    {"$eq": ["$status", "Done"]},
+                ]}}},
+                {"$group": {"_id": None, "v": {"$sum": "$story_points"}}},
+            ],
+            "as": "vel",
+        }},
+        {"$project": {
+            "name": 1,
+            "velocity": {"$ifNull": [{"$arrayElemAt": ["$vel.v", 0]}, 0]},
+        }},
+    ]
+
+    for sprint in await db.sprints.aggregate(pipeline).to_list(length=None):
         velocity_history.append({
-            "sprint_id": sprint_id_str,
+            "sprint_id": str(sprint["_id"]),
             "sprint_name": sprint["name"],
-            "velocity": done_points,
+            "velocity": sprint["velocity"],
         })
 
-    # Return in chronological order
-    velocity_history.reverse()
     return velocity_history
 
 
+def _sprint_day_series(start: datetime, total_days: int) -> tuple:
+    """
+    Return (day offsets, 'YYYY-MM-DD' strings) for every day of a sprint,
+    built with one vectorised datetime64 add instead of a per-day loop.
+    """
+    days = np.arange(total_days + 1)
+    base = np.datetime64(start.date(), 'D')
+    dates = np.datetime_as_string(base + days.astype('timedelta64[D]'), unit='D').tolist()
+    return days, dates
+
+
+async def _sum_sprint_points(db, sprint_id: str) -> tuple:
+    """
+    Return (total_points, done_points) for a sprint, summed by MongoDB so
+    only the two scalars cross the wire instead of every item document.
+    """
+    pipeline = [
+        {"$match": {"sprint_id": sprint_id}},
+        {"$group": {
+            "_id": None,
+            "total": {"$sum": "$story_points"},
+            "done": {"$sum": {"$cond": [{"$eq": ["$status", "Done"]}, "$story_points", 0]}},
+        }},
+    ]
+    docs = await db.backlog_items.aggregate(pipeline).to_list(1)
+    if not docs:
+        return 0, 0
+    return docs[0]["total"], docs[0]["done"]
+
+
 async def calculate_burndown_data(sprint_id: str) -> dict | None:
     """
     Build a simple ideal vs actual burndown chart dataset for a sprint.
@@ -362,37 +531,27 @@ async def calculate_burndown_data(sprint_id: str) -> dict | None:
     if not start or not end:
         return {"error": "Sprint has no dates configured", "data": []}
 
-    # Collect all items in the sprint
-    total_points = 0
-    done_points = 0
-    async for item in db.backlog_items.find({"sprint_id": sprint_id}):
-        sp = item.get("story_points", 0)
-        total_points += sp
-        if item.get("status") == "Done":
-            done_points += sp
+    # Sum all items in the sprint server-side
+    total_points, done_points = await _sum_sprint_points(db, sprint_id)
 
     remaining_points = total_points - done_points
 
     # Build ideal burndown line
     try:
         if isinstance(start, str):
-            start = datetime.strptime(start, '%Y-%m-%d')
+            start = datetime.fromisoformat(start)
         if isinstance(end, str):
-            end = datetime.strptime(end, '%Y-%m-%d')
+            end = datetime.fromisoformat(end)
 
         total_days = max(1, (end - start).days)
         daily_ideal = total_points / total_days
 
-        ideal_data = []
-        for day in range(total_days + 1):
-            current_date = start + timedelta(days=day)
-            ideal_remaining = max(0, total_points - daily_ideal * day)
-            ideal_data.append({
-                "date": current_date.strftime('%Y-%m-%d'),
-                "ideal": round(ideal_remaining, 1),
-            })
+        days, dates = _sprint_day_series(start, total_days)
+        ideal = np.maximum(0, total_points - daily_ideal * days).round(1)
+        # Column layout: ideal stays an ndarray, serialised directly by orjson
+        ideal_data = {"dates": dates, "ideal": ideal}
     except (ValueError, TypeError):
-        ideal_data = []
+        ideal_data = {"dates": [], "ideal": []}
 
     return {
         "sprint_name": sprint["name"],
@@ -422,34 +581,23 @@ async def calculate_burnup_data(sprint_id: str) -> dict | None:
     if not start or not end:
         return {"error": "Sprint has no dates configured", "data": []}
 
-    total_points = 0
-    done_points = 0
-    async for item in db.backlog_items.find({"sprint_id": sprint_id}):
-        sp = item.get("story_points", 0)
-        total_points += sp
-        if item.get("status") == "Done":
-            done_points += sp
+    total_points, done_points = await _sum_sprint_points(db, sprint_id)
 
     try:
         if isinstance(start, str):
-            start = datetime.strptime(start, '%Y-%m-%d')
+            start = datetime.fromisoformat(start)
         if isinstance(end, str):
-            end = datetime.strptime(end, '%Y-%m-%d')
+            end = datetime.fromisoformat(end)
 
         total_days = max(1, (end - start).days)
         daily_target = total_points / total_days
 
-        burnup_data = []
-        for day in range(total_days + 1):
-            current_date = start + timedelta(days=day)
-            target = min(total_points, round(daily_target * day, 1))
-            burnup_data.append({
-                "date": current_date.strftime('%Y-%m-%d'),
-                "target": target,
-                "scope": total_points,
-            })
+        days, dates = _sprint_day_series(start, total_days)
+        target = np.minimum(total_points, (daily_target * days).round(1))
+        # Column layout; scope is constant (= total_points) so it is not repeated
+        burnup_data = {"dates": dates, "target": target}
     except (ValueError, TypeError):
-        burnup_data = []
+        burnup_data = {"dates": [], "target": []}
 
     return {
         "sprint_name": sprint["name"],
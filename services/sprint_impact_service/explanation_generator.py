@@ -11,8 +11,11 @@ Returns a typed dict with `short_title`, `detailed_explanation`,
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TypedDict
 
+import numpy as np
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Return type
@@ -50,6 +53,29 @@ def _confidence_color(
     return "green"
 
 
+_COLOR_NAMES = np.array(["green", "yellow", "red"])
+
+
+def _confidence_color_batch(
+    schedule_risk: np.ndarray,
+    quality_risk:  np.ndarray,
+    velocity_change: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorised _confidence_color: same thresholds, evaluated branch-free over
+    whole arrays.  Returns an array of "green" / "yellow" / "red" strings.
+    """
+    red    = (schedule_risk > 55) | (quality_risk > 60) | (velocity_change < -30)
+    yellow = (schedule_risk > 30) | (quality_risk > 30) | (velocity_change < -10)
+    level  = np.where(red, 2, np.where(yellow, 1, 0)).astype(np.int8)
+    return _COLOR_NAMES[level]
+
+
+def _rendered(data: dict, key: str) -> str | None:
+    """Cache-key form of an interpolated field; None when absent (builders default it)."""
+    return str(data[key]) if key in data else None
+
+
 def _fmt_pct(value: float, *, decimals: int = 0) -> str:
     return f"{value:.{decimals}f}%"
 
@@ -211,8 +237,16 @@ class ExplanationGenerator:
     >>> gen = ExplanationGenerator()
     >>> explanation = gen.generate_explanation(recommendation_data)
     >>> print(explanation["short_title"])
+
+    Results are memoised in a bounded LRU keyed on every input the builders
+    read, so re-rendering the same recommendation skips the string formatting.
     """
 
+    _CACHE_SIZE = 2048
+
+    def __init__(self) -> None:
+        self._cache: OrderedDict = OrderedDict()
+
     def generate_explanation(self, recommendation_data: dict) -> ExplanationResult:
         """
         Parameters
@@ -236,13 +270,64 @@ class ExplanationGenerator:
         -------
         ExplanationResult
         """
-        action      : str        = (recommendation_data.get("recommendation_type") or "ADD").upper()
-        target      : dict | None = recommendation_data.get("target_ticket")
-        impact      : dict        = recommendation_data.get("impact_analysis") or {}
-        work_item   : dict        = recommendation_data.get("work_item_data") or {}
+        risk_scores = self._risk_scores(recommendation_data)
 
-        # Normalise risk scores ─────────────────────────────────────────────
-        risk_scores: dict = {
+        color = _confidence_color(
+            risk_scores["schedule_risk"],
+            risk_scores["quality_risk"],
+            risk_scores["velocity_change"],
+        )
+        return self._cached_dispatch(recommendation_data, risk_scores, color)
+
+    def generate_explanations(self, recommendations: list[dict]) -> list[ExplanationResult]:
+        """
+        Batch form of generate_explanation: confidence colours for every
+        recommendation are derived in one vectorised pass.
+        """
+        if not recommendations:
+            return []
+        scores = [self._risk_scores(r) for r in recommendations]
+        colors = _confidence_color_batch(
+            np.fromiter((rs["schedule_risk"]   for rs in scores), dtype=np.float64, count=len(scores)),
+            np.fromiter((rs["quality_risk"]    for rs in scores), dtype=np.float64, count=len(scores)),
+            np.fromiter((rs["velocity_change"] for rs in scores), dtype=np.float64, count=len(scores)),
+        )
+        return [
+            self._cached_dispatch(r, rs, str(c))
+            for r, rs, c in zip(recommendations, scores, colors)
+        ]
+
+    def _cached_dispatch(self, recommendation_data: dict, risk_scores: dict, color: str) -> ExplanationResult:
+        target    = recommendation_data.get("target_ticket") or {}
+        work_item = recommendation_data.get("work_item_data") or {}
+        # Interpolated fields are keyed as the builders render them: 17 and
+        # 17.0 hash equal but print as "17" and "17.0".  The risk floats stay
+        # numeric since the builders branch on their exact values.
+        key = (
+            (recommendation_data.get("recommendation_type") or "ADD").upper(),
+            _rendered(recommendation_data, "reasoning"),
+            _rendered(work_item, "title"), _rendered(work_item, "story_points"),
+            _rendered(target, "title"), _rendered(target, "story_points"), _rendered(target, "priority"),
+            risk_scores["schedule_risk"], risk_scores["quality_risk"], risk_scores["velocity_change"],
+            str(risk_scores["days_remaining"]), str(risk_scores["free_capacity"]),
+            color,
+        )
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._dispatch(recommendation_data, risk_scores, color)
+            self._cache[key] = cached
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        # Callers get their own copy so they can annotate it freely
+        return ExplanationResult(**cached)
+
+    @staticmethod
+    def _risk_scores(recommendation_data: dict) -> dict:
+        """Normalise the impact_analysis numbers used by every builder."""
+        impact: dict = recommendation_data.get("impact_analysis") or {}
+        return {
             "schedule_risk":  float(impact.get("schedule_risk",   0)),
             "quality_risk":   float(impact.get("quality_risk",    0)),
             "velocity_change": float(impact.get("velocity_change", 0)),
@@ -250,11 +335,11 @@ class ExplanationGenerator:
             "free_capacity":  impact.get("free_capacity",  "?"),
         }
 
-        color = _confidence_color(
-            risk_scores["schedule_risk"],
-            risk_scores["quality_risk"],
-            risk_scores["velocity_change"],
-        )
+    @staticmethod
+    def _dispatch(recommendation_data: dict, risk_scores: dict, color: str) -> ExplanationResult:
+        action      : str        = (recommendation_data.get("recommendation_type") or "ADD").upper()
+        target      : dict | None = recommendation_data.get("target_ticket")
+        work_item   : dict        = recommendation_data.get("work_item_data") or {}
 
         # Dispatch to per-action builder ────────────────────────────────────
         match action:
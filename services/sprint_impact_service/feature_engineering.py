@@ -41,10 +41,22 @@ le_prio_quality.pkl    →  build_quality_features()
   UI map   : Low→Low(2), Medium→Medium(4), High→High(0), Critical→Highest(1)
 """
 
+import functools
+import logging
+import re
 import numpy as np
-import pandas as pd
 import warnings
-import sys
+from typing import NamedTuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Per-build traces are DEBUG: off in production, so no formatting or stderr
+# writes on the request path
+logger = logging.getLogger(__name__)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # Module-level artifact holders — populated at startup by model_loader
@@ -59,32 +71,80 @@ _prod_scaler       = None   # sklearn StandardScaler from productivity_artifacts
 _prod_le_type      = None   # sklearn LabelEncoder   from productivity_artifacts.pkl
 _prod_le_prio      = None   # sklearn LabelEncoder   from productivity_artifacts.pkl
 _quality_le_prio   = None   # sklearn LabelEncoder   from le_prio_quality.pkl
+_effort_le_type_ref = None  # sklearn LabelEncoder   from effort_artifacts.pkl (optional)
+
+# label → code tables built from each encoder's classes_ (see _label_table)
+_effort_type_codes  = {}
+_risk_type_codes    = {}
+_risk_prio_codes    = {}
+_prod_type_codes    = {}
+_prod_prio_codes    = {}
+_quality_prio_codes = {}
+
+# (ui_type, ui_prio) → (type_code, prio_code), see _fuse_ui_codes
+_risk_ui_codes      = {}
+_prod_ui_codes      = {}
+
+# _prod_scaler as float32 (mean, scale), see _scaler_affine
+_prod_affine        = None
 
 
 def set_tfidf_vectorizer(vec):
     global _tfidf_vectorizer
     _tfidf_vectorizer = vec
+    _tfidf_cached.cache_clear()   # vectors from a previous vectorizer are stale
 
 def set_risk_artifacts(imputer, le_type, le_prio):
-    global _risk_imputer, _risk_le_type, _risk_le_prio
+    global _risk_imputer, _risk_le_type, _risk_le_prio, _risk_type_codes, _risk_prio_codes, _risk_ui_codes
     _risk_imputer = imputer
     _risk_le_type = le_type
     _risk_le_prio = le_prio
+    _risk_type_codes = _label_table(le_type)
+    _risk_prio_codes = _label_table(le_prio)
+    _risk_ui_codes   = _fuse_ui_codes(_ui_type_to_risk, _ui_prio_to_risk,
+                                      _risk_type_codes, _risk_prio_codes)
 
 def set_risk_scaler(scaler):
     """Called by model_loader if a StandardScaler is found in risk_artifacts.pkl."""
     global _risk_scaler
     _risk_scaler = scaler
 
+def _scaler_affine(scaler):
+    """
+    A fitted StandardScaler as contiguous float32 ``(mean, scale)`` so rows
+    are standardised with plain NumPy instead of scaler.transform (which
+    re-validates its input on every call).  Applied as subtract-then-divide
+    in float32, exactly what transform() does on float32 input: multiplying
+    by a reciprocal is 1 ulp off on some columns, and the standardised type
+    code sits on a productivity-booster split.  None if the scaler doesn't
+    expose mean_/scale_, in which case transform() is used.
+    """
+    n = getattr(scaler, 'n_features_in_', None)
+    if n is None:
+        return None
+    mean  = getattr(scaler, 'mean_', None)
+    scale = getattr(scaler, 'scale_', None)
+    mean  = np.zeros(n) if mean is None or not getattr(scaler, 'with_mean', True) else mean
+    scale = np.ones(n) if scale is None or not getattr(scaler, 'with_std', True) else scale
+    return (np.ascontiguousarray(mean, dtype=np.float32),
+            np.ascontiguousarray(scale, dtype=np.float32))
+
 def set_productivity_artifacts(scaler, le_type, le_prio):
-    global _prod_scaler, _prod_le_type, _prod_le_prio
+    global _prod_scaler, _prod_le_type, _prod_le_prio, _prod_type_codes, _prod_prio_codes, _prod_ui_codes
+    global _prod_affine
     _prod_scaler  = scaler
+    _prod_affine  = _scaler_affine(scaler) if scaler is not None else None
     _prod_le_type = le_type
     _prod_le_prio = le_prio
+    _prod_type_codes = _label_table(le_type)
+    _prod_prio_codes = _label_table(le_prio)
+    _prod_ui_codes   = _fuse_ui_codes(_ui_type_to_prod, _ui_prio_to_prod,
+                                      _prod_type_codes, _prod_prio_codes)
 
 def set_quality_artifacts(le_prio):
-    global _quality_le_prio
+    global _quality_le_prio, _quality_prio_codes
     _quality_le_prio = le_prio
+    _quality_prio_codes = _label_table(le_prio)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -95,110 +155,261 @@ def set_quality_artifacts(le_prio):
 # UI sends: Low / Medium / High / Critical   (priority)
 #           Task / Story / Bug / Subtask      (type)
 
+_UI_TYPES      = ('Task', 'Story', 'Bug', 'Subtask')
+_UI_PRIORITIES = ('Low', 'Medium', 'High', 'Critical')
+
+# Effort, risk and productivity share the Jira type vocabulary, and risk and
+# productivity share the Blocker/Critical/Major/Minor priorities — one map each
+_JIRA_TYPE_MAP = {'Bug': 'Bug', 'Story': 'Story',
+                  'Task': 'Technical task', 'Subtask': 'Technical task'}
+_JIRA_PRIO_MAP = {'Low': 'Minor', 'Medium': 'Major',
+                  'High': 'Critical', 'Critical': 'Blocker'}
+_EFFORT_TYPE_MAP = _RISK_TYPE_MAP = _PROD_TYPE_MAP = _JIRA_TYPE_MAP
+_RISK_PRIO_MAP   = _PROD_PRIO_MAP = _JIRA_PRIO_MAP
+_QUALITY_PRIO_MAP = {'Low': 'Low', 'Medium': 'Medium',
+                     'High': 'High', 'Critical': 'Highest'}
+
 def _ui_type_to_effort(ui_type: str) -> str:
     """Map UI type → effort le_type class."""
-    return {'Bug': 'Bug', 'Story': 'Story',
-            'Task': 'Technical task', 'Subtask': 'Technical task'}.get(ui_type, 'Technical task')
+    return _EFFORT_TYPE_MAP.get(ui_type, 'Technical task')
 
 def _ui_type_to_risk(ui_type: str) -> str:
     """Map UI type → risk le_type class."""
-    return {'Bug': 'Bug', 'Story': 'Story',
-            'Task': 'Technical task', 'Subtask': 'Technical task'}.get(ui_type, 'Technical task')
+    return _RISK_TYPE_MAP.get(ui_type, 'Technical task')
 
 def _ui_type_to_prod(ui_type: str) -> str:
     """Map UI type → productivity le_type class."""
-    return {'Bug': 'Bug', 'Story': 'Story',
-            'Task': 'Technical task', 'Subtask': 'Technical task'}.get(ui_type, 'Technical task')
+    return _PROD_TYPE_MAP.get(ui_type, 'Technical task')
 
 def _ui_prio_to_risk(ui_prio: str) -> str:
     """Map UI priority → risk le_prio class (Blocker/Critical/Major/Minor/Missing_Content/Trivial)."""
-    return {'Low': 'Minor', 'Medium': 'Major',
-            'High': 'Critical', 'Critical': 'Blocker'}.get(ui_prio, 'Major')
+    return _RISK_PRIO_MAP.get(ui_prio, 'Major')
 
 def _ui_prio_to_prod(ui_prio: str) -> str:
     """Map UI priority → productivity le_prio class (Blocker/Critical/Major/Minor only)."""
-    return {'Low': 'Minor', 'Medium': 'Major',
-            'High': 'Critical', 'Critical': 'Blocker'}.get(ui_prio, 'Major')
+    return _PROD_PRIO_MAP.get(ui_prio, 'Major')
 
 def _ui_prio_to_quality(ui_prio: str) -> str:
     """Map UI priority → quality le_prio class (High/Highest/Low/Lowest/Medium)."""
-    return {'Low': 'Low', 'Medium': 'Medium',
-            'High': 'High', 'Critical': 'Highest'}.get(ui_prio, 'Medium')
+    return _QUALITY_PRIO_MAP.get(ui_prio, 'Medium')
 
 
-def _safe_le_transform(le, value: str, fallback: int = 0) -> int:
-    """Call le.transform([value]) safely; return fallback if unseen label."""
-    if le is None:
-        return fallback
-    try:
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            return int(le.transform([value])[0])
-    except Exception:
-        return fallback
+def _label_table(le) -> dict:
+    """
+    {class_label: code} from a fitted LabelEncoder.  LabelEncoder codes are the
+    positions in classes_, so this gives the same result as le.transform()
+    with an O(1) dict lookup instead of a numpy searchsorted per call.
+    """
+    if le is None or getattr(le, 'classes_', None) is None:
+        return {}
+    return {str(c): i for i, c in enumerate(le.classes_)}
+
+
+def _encode_label(value: str, table: dict, fallback: int = 0) -> int:
+    """Code for value from a _label_table; fallback if unseen (as le.transform would be)."""
+    return table.get(value, fallback)
+
+
+def _fuse_ui_codes(type_fn, prio_fn, type_codes: dict, prio_codes: dict) -> dict:
+    """
+    {(ui_type, ui_prio): (type_code, prio_code)} over the whole UI vocabulary,
+    so a builder reaches both codes with one hash lookup.
+    """
+    return {
+        (t, p): (_encode_label(type_fn(t), type_codes), _encode_label(prio_fn(p), prio_codes))
+        for t in _UI_TYPES for p in _UI_PRIORITIES
+    }
+
+
+def _risk_codes(ui_type: str, ui_prio: str) -> tuple:
+    codes = _risk_ui_codes.get((ui_type, ui_prio))
+    if codes is None:   # value outside the UI vocabulary
+        codes = (_encode_label(_ui_type_to_risk(ui_type), _risk_type_codes),
+                 _encode_label(_ui_prio_to_risk(ui_prio), _risk_prio_codes))
+    return codes
+
+
+def _prod_codes(ui_type: str, ui_prio: str) -> tuple:
+    codes = _prod_ui_codes.get((ui_type, ui_prio))
+    if codes is None:   # value outside the UI vocabulary
+        codes = (_encode_label(_ui_type_to_prod(ui_type), _prod_type_codes),
+                 _encode_label(_ui_prio_to_prod(ui_prio), _prod_prio_codes))
+    return codes
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 1. Effort features  (105 features: 5 numeric + 100 TF-IDF)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _get_tfidf_vector(text: str, n_components: int = 100) -> np.ndarray:
-    """Transform text with the real fitted TF-IDF vectorizer from effort_artifacts."""
-    if _tfidf_vectorizer is None:
-        return np.zeros(n_components, dtype=np.float32)
+def _scatter_py(out, indices, data, n):
+    keep = indices < n
+    out[indices[keep]] = data[keep]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scatter(out, indices, data, n):
+        """Sparse → dense fill of the first n TF-IDF columns (compiled)."""
+        for k in range(indices.size):
+            i = indices[k]
+            if i < n:
+                out[i] = data[k]
+else:
+    _scatter = _scatter_py
+
+
+# Shared read-only zero vector (and its bytes) for texts with no known terms
+_ZERO_TFIDF = np.zeros(100, dtype=np.float32)
+_ZERO_TFIDF.flags.writeable = False
+_ZERO_TFIDF_BYTES = _ZERO_TFIDF.tobytes()
+
+
+@functools.lru_cache(maxsize=4096)
+def _tfidf_cached(text: str, n_components: int) -> bytes:
+    """
+    Transform text with the real fitted TF-IDF vectorizer from effort_artifacts.
+
+    Works on the sparse CSR row directly: only the non-zero terms with a
+    column index below n_components are scattered into the output, so no
+    vocabulary-wide dense row is ever allocated.  Returned as immutable
+    bytes so cached entries cannot be mutated by callers.
+    """
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')
-        vec = _tfidf_vectorizer.transform([text]).toarray()[0]
-    if len(vec) < n_components:
-        vec = np.pad(vec, (0, n_components - len(vec)))
-    return vec[:n_components].astype(np.float32)
+        sp = _tfidf_vectorizer.transform([text])
+    if sp.nnz == 0 and n_components == _ZERO_TFIDF.size:
+        return _ZERO_TFIDF_BYTES    # all out-of-vocabulary: share one buffer
+    vec = np.zeros(n_components, dtype=np.float32)
+    _scatter(vec, sp.indices.astype(np.int32, copy=False),
+             sp.data.astype(np.float32, copy=False), n_components)
+    return vec.tobytes()
+
+
+def _get_tfidf_vector(text: str, n_components: int = 100) -> np.ndarray:
+    """Read-only float32 TF-IDF vector, memoised per text (see _tfidf_cached)."""
+    if _tfidf_vectorizer is None:
+        return _ZERO_TFIDF if n_components == _ZERO_TFIDF.size else np.zeros(n_components, dtype=np.float32)
+    return np.frombuffer(_tfidf_cached(text, n_components), dtype=np.float32)
 
 
 
 def set_effort_le_type(le):
-    global _effort_le_type_ref
+    global _effort_le_type_ref, _effort_type_codes
     _effort_le_type_ref = le
+    _effort_type_codes  = _label_table(le)
+
+
+_HTTP_RE = re.compile('http', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _desc_stats(description: str) -> tuple:
+    """
+    (total_links, length) for a description, computed once and shared by the
+    effort, schedule-risk and quality builders for the same ticket.
+    """
+    # Case-insensitive scan instead of description.lower() (a full copy), and
+    # count(',') + 1 == len(split(',')) without building the substring list
+    total_links = float(len(_HTTP_RE.findall(description)) + (description.count(',') + 1) // 3)
+    return total_links, len(description)
+
+
+class _Derived(NamedTuple):
+    """Item/context scalars shared by every builder (see derive_features)."""
+    ui_type:        str
+    ui_prio:        str
+    story_points:   float
+    days_remaining: float   # floored at 1 day
+    pressure_index: float   # story_points / days_remaining
+    sprint_load:    float
+    team_velocity:  float
+    total_links:    float
+    desc_len:       int
+
+
+def derive_features(item_data: dict, sprint_context: dict) -> _Derived:
+    """
+    Compute the scalars the four builders have in common once per
+    prediction; pass the result as ``derived=`` to skip re-deriving them.
+    """
+    story_points   = float(item_data.get('story_points', 5))
+    days_remaining = max(1.0, float(sprint_context.get('days_remaining', 14)))
+    total_links, desc_len = _desc_stats(item_data.get('description', ''))
+    return _Derived(
+        ui_type        = item_data.get('type', 'Task'),
+        ui_prio        = item_data.get('priority', 'Medium'),
+        story_points   = story_points,
+        days_remaining = days_remaining,
+        pressure_index = story_points / days_remaining,
+        sprint_load    = float(sprint_context.get('sprint_load_7d', 0)),
+        team_velocity  = float(sprint_context.get('team_velocity_14d', 30)),
+        total_links    = total_links,
+        desc_len       = desc_len,
+    )
+
+
+def _derive_batch(items: list, sprint_context: dict, derived=None) -> list:
+    """_Derived per item, reusing any precomputed entries in ``derived``."""
+    if not derived:
+        return [derive_features(it, sprint_context) for it in items]
+    return [d or derive_features(it, sprint_context) for it, d in zip(items, derived)]
 
 
-def build_effort_features(item_data: dict, sprint_context: dict) -> dict:
+# Column order of the XGBoost effort models (feature_names stored in the boosters)
+EFFORT_COLS = [
+    'sprint_load_7d', 'team_velocity_14d', 'pressure_index', 'total_links', 'Type_Code',
+] + [f'txt_{i}' for i in range(100)]
+
+
+def build_effort_features(
+    item_data: dict, sprint_context: dict, derived: _Derived = None, out: np.ndarray = None,
+) -> np.ndarray:
     """
-    Returns a 105-key dict matching the XGBoost effort model feature names exactly:
+    Returns a (1, 105) float32 row in EFFORT_COLS order, matching the XGBoost
+    effort model feature names exactly:
     sprint_load_7d, team_velocity_14d, pressure_index, total_links, Type_Code,
     txt_0 … txt_99
+
+    ``out`` optionally supplies a (1, 105) float32 buffer to fill and return.
     """
-    title        = item_data.get('title', '')
-    description  = item_data.get('description', '')
-    story_points = float(item_data.get('story_points', 5))
-    ui_type      = item_data.get('type', 'Task')
-
-    sprint_load    = float(sprint_context.get('sprint_load_7d', 0))
-    team_velocity  = float(sprint_context.get('team_velocity_14d', 30))
-    days_remaining = float(sprint_context.get('days_remaining', 14))
-
-    pressure_index = story_points / max(1.0, days_remaining)
-    total_links    = float(
-        description.lower().count('http') + len(description.split(',')) // 3
-    )
+    return build_effort_features_batch(
+        [item_data], sprint_context, derived=[derived] if derived else None, out=out)
 
-    type_label = _ui_type_to_effort(ui_type)
-    type_code  = float(_safe_le_transform(_effort_le_type_ref, type_label))
 
-    tfidf = _get_tfidf_vector(f"{title} {description}", n_components=100)
+def build_effort_features_batch(
+    items: list, sprint_context: dict, derived: list = None, out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Row-stacked form of build_effort_features: an (N, 105) float32 matrix
+    for many items sharing one sprint context, filled in place so the three
+    quantile boosters can score the whole batch in one call each.
+    """
+    n  = len(items)
+    ds = _derive_batch(items, sprint_context, derived)
+
+    if out is None:
+        out = np.empty((n, len(EFFORT_COLS)), dtype=np.float32)
+    for i, (item_data, d) in enumerate(zip(items, ds)):
+        type_label = _ui_type_to_effort(d.ui_type)
+        type_code  = float(_encode_label(type_label, _effort_type_codes))
+
+        row = out[i]
+        row[0] = d.sprint_load
+        row[1] = d.team_velocity
+        row[2] = d.pressure_index
+        row[3] = d.total_links
+        row[4] = type_code
+
+        combined_text = item_data.get('title', '') + " " + item_data.get('description', '')
+        if combined_text.isspace():
+            row[5:] = _ZERO_TFIDF     # nothing to tokenise — skip the vectorizer and cache
+        else:
+            row[5:] = _get_tfidf_vector(combined_text, n_components=100)
 
-    features = {
-        'sprint_load_7d':    sprint_load,
-        'team_velocity_14d': team_velocity,
-        'pressure_index':    pressure_index,
-        'total_links':       total_links,
-        'Type_Code':         type_code,
-    }
-    for i, v in enumerate(tfidf):
-        features[f'txt_{i}'] = float(v)
-    
     # Log to terminal for visibility
-    print(f"[BUILD_EFFORT_FEATURES] Keys: {len(features)}, TF-IDF shape: {tfidf.shape}, dtype: {tfidf.dtype}", file=sys.stderr)
-    
-    return features
+    logger.debug("[BUILD_EFFORT_FEATURES] Shape: %s, dtype: %s", out.shape, out.dtype)
+
+    return out
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -233,7 +444,11 @@ def _compute_contextual_author_load(sprint_context: dict) -> float:
     return _AUTHOR_LOAD_FALLBACK
 
 
-def build_schedule_risk_features(item_data: dict, sprint_context: dict) -> pd.DataFrame:
+SCHEDULE_RISK_COLS = ['Story_Point', 'total_links', 'total_comments', 'author_total_load',
+                      'link_density', 'comment_density', 'pressure_index', 'Type_Code', 'Priority_Code']
+
+
+def build_schedule_risk_features(item_data: dict, sprint_context: dict, derived: _Derived = None) -> np.ndarray:
     """
     9 features in the exact order stored in risk_artifacts feature_names:
     Story_Point, total_links, total_comments, author_total_load,
@@ -249,64 +464,69 @@ def build_schedule_risk_features(item_data: dict, sprint_context: dict) -> pd.Da
     present we apply min-max normalisation to the two highest-magnitude
     features (Story_Point and pressure_index) to keep them in [0, 1].
 
-    Returns a Pandas DataFrame with explicit column names.
+    Returns a (1, 9) float32 row in SCHEDULE_RISK_COLS order.
     """
-    description  = item_data.get('description', '')
-    story_points = float(item_data.get('story_points', 5))
-    ui_prio      = item_data.get('priority', 'Medium')
-    ui_type      = item_data.get('type', 'Task')
+    return build_schedule_risk_features_batch(
+        [item_data], sprint_context, derived=[derived] if derived else None)
 
-    days_remaining = float(sprint_context.get('days_remaining', 14))
 
-    total_links     = float(description.lower().count('http') +
-                            len(description.split(',')) // 3)
-    total_comments  = 0.0  # default for new tickets (no Jira comment history)
+def build_schedule_risk_features_batch(
+    items: list, sprint_context: dict, derived: list = None,
+) -> np.ndarray:
+    """
+    Column-wise form of build_schedule_risk_features for many backlog items
+    sharing one sprint context.  Returns an (N, 9) float32 matrix in
+    SCHEDULE_RISK_COLS order, ready for a single predict_proba call.  A plain
+    ndarray rather than a DataFrame: the classifier only checks the column
+    count, so pandas' index and dtype bookkeeping is pure per-call overhead.
+    ``derived`` optionally supplies a precomputed _Derived per item.
+    """
+    n = len(items)
+    ds = _derive_batch(items, sprint_context, derived)
 
     # FIX: contextual author load instead of constant 4519
-    author_load     = _compute_contextual_author_load(sprint_context)
-
-    link_density    = total_links / max(1.0, story_points)
-    comment_density = total_comments / max(1.0, story_points)
-    pressure_index  = story_points / max(1.0, days_remaining)
-
-    type_label = _ui_type_to_risk(ui_type)
-    prio_label = _ui_prio_to_risk(ui_prio)
-    type_code  = float(_safe_le_transform(_risk_le_type, type_label))
-    prio_code  = float(_safe_le_transform(_risk_le_prio, prio_label))
-
-    X = np.array([[
-        story_points, total_links, total_comments, author_load,
-        link_density, comment_density, pressure_index,
-        type_code, prio_code,
-    ]])
+    author_load = _compute_contextual_author_load(sprint_context)
+
+    # float32 throughout: xgboost casts every input to float32 internally, so
+    # handing it float32 skips that extra cast + copy at the predict boundary
+    X = np.empty((n, 9), dtype=np.float32)
+    story_points = X[:, 0]
+    story_points[:] = np.fromiter((d.story_points for d in ds), dtype=np.float32, count=n)
+    X[:, 1] = np.fromiter((d.total_links for d in ds), dtype=np.float32, count=n)
+    X[:, 2] = 0.0   # total_comments: default for new tickets (no Jira comment history)
+    X[:, 3] = author_load
+    sp_floor = np.maximum(1.0, story_points)
+    X[:, 4] = X[:, 1] / sp_floor                              # link_density
+    X[:, 5] = X[:, 2] / sp_floor                              # comment_density
+    X[:, 6] = np.fromiter((d.pressure_index for d in ds), dtype=np.float32, count=n)
+    if n:
+        X[:, 7:9] = [_risk_codes(d.ui_type, d.ui_prio) for d in ds]
 
     # Apply the fitted SimpleImputer (fills any NaN)
-    if _risk_imputer is not None:
+    if _risk_imputer is not None and n:
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            X = _risk_imputer.transform(X)
-
-    feature_names = ['Story_Point', 'total_links', 'total_comments', 'author_total_load',
-                     'link_density', 'comment_density', 'pressure_index', 'Type_Code', 'Priority_Code']
-    df = pd.DataFrame(X, columns=feature_names)
+            X = _risk_imputer.transform(X).astype(np.float32, copy=False)
 
     # ── Scaler guardrail ─────────────────────────────────────────────────────
     # XGBoost trees are scale-invariant (split thresholds are absolute value
     # comparisons), so feature scaling must NOT be applied as a fallback —
     # doing so shifts every learned threshold away from the training distribution.
     # Only apply a StandardScaler if one was explicitly saved in risk_artifacts.pkl.
-    if _risk_scaler is not None:
+    if _risk_scaler is not None and n:
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            df[feature_names] = _risk_scaler.transform(df[feature_names])
-        print("[BUILD_SCHEDULE_RISK_FEATURES] StandardScaler applied", file=sys.stderr)
+            X = _risk_scaler.transform(X).astype(np.float32, copy=False)
+        logger.debug("[BUILD_SCHEDULE_RISK_FEATURES] StandardScaler applied")
     else:
-        print("[BUILD_SCHEDULE_RISK_FEATURES] No scaler — raw features passed (correct for XGBoost)", file=sys.stderr)
+        logger.debug("[BUILD_SCHEDULE_RISK_FEATURES] No scaler — raw features passed (correct for XGBoost)")
 
-    print(f"[BUILD_SCHEDULE_RISK_FEATURES] Shape: {df.shape}", file=sys.stderr)
-    print(f"[BUILD_SCHEDULE_RISK_FEATURES] Values: {df.iloc[0].to_dict()}", file=sys.stderr)
+    logger.debug("[BUILD_SCHEDULE_RISK_FEATURES] Shape: %s", X.shape)
+    if n == 1 and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[BUILD_SCHEDULE_RISK_FEATURES] Values: %s",
+                     dict(zip(SCHEDULE_RISK_COLS, X[0].tolist())))
 
-    return df
+    return X
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -318,6 +538,8 @@ def build_productivity_features(
     sprint_context: dict,
     scaler_mean: np.ndarray = None,    # kept for backward compat; ignored
     scaler_scale: np.ndarray = None,   # kept for backward compat; ignored
+    derived: _Derived = None,
+    out: np.ndarray = None,
 ) -> np.ndarray:
     """
     9 features verified against the StandardScaler statistics from
@@ -335,40 +557,53 @@ def build_productivity_features(
     [6] sprint_progress
     [7] type_code
     [8] prio_code
+
+    ``out`` optionally supplies a (1, 9) float32 buffer for the raw row.
     """
-    story_points   = float(item_data.get('story_points', 5))
-    ui_prio        = item_data.get('priority', 'Medium')
-    ui_type        = item_data.get('type', 'Task')
+    return build_productivity_features_batch(
+        [item_data], sprint_context, scaler_mean, scaler_scale,
+        derived=[derived] if derived else None, out=out)
+
 
-    days_remaining = float(max(1, sprint_context.get('days_remaining', 14)))
-    sprint_load    = float(sprint_context.get('sprint_load_7d', 0))
-    team_velocity  = float(sprint_context.get('team_velocity_14d', 30))
+def build_productivity_features_batch(
+    items: list,
+    sprint_context: dict,
+    scaler_mean: np.ndarray = None,
+    scaler_scale: np.ndarray = None,
+    derived: list = None,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Column-wise form of build_productivity_features: an (N, 9) float32
+    matrix for many items sharing one sprint context.  The StandardScaler is
+    applied once to the whole matrix instead of once per row.
+    """
+    n  = len(items)
+    ds = _derive_batch(items, sprint_context, derived)
+
+    story_points   = np.fromiter((d.story_points   for d in ds), dtype=np.float64, count=n)
+    days_remaining = np.fromiter((d.days_remaining for d in ds), dtype=np.float64, count=n)
     days_in        = float(sprint_context.get('days_since_sprint_start', 0))
 
-    log_pressure   = np.log(story_points / days_remaining)
-    log_days       = np.log(1.0 + days_remaining)
-    hours_pressure = story_points / (days_remaining * 24.0)
-    sprint_progress= days_in / max(1.0, days_in + days_remaining)
-
-    type_label = _ui_type_to_prod(ui_type)
-    prio_label = _ui_prio_to_prod(ui_prio)
-    type_code  = float(_safe_le_transform(_prod_le_type, type_label))
-    prio_code  = float(_safe_le_transform(_prod_le_prio, prio_label))
-
-    raw = np.array([[
-        story_points,
-        log_pressure,
-        log_days,
-        team_velocity,
-        sprint_load,
-        hours_pressure,
-        sprint_progress,
-        type_code,
-        prio_code,
-    ]], dtype=np.float32)
+    raw = np.empty((n, 9), dtype=np.float32) if out is None else out
+    raw[:, 0] = story_points
+    raw[:, 1] = np.log(story_points / days_remaining)            # log-pressure
+    raw[:, 2] = np.log(1.0 + days_remaining)                     # log-scale days
+    raw[:, 3] = np.fromiter((d.team_velocity for d in ds), dtype=np.float64, count=n)
+    raw[:, 4] = np.fromiter((d.sprint_load   for d in ds), dtype=np.float64, count=n)
+    raw[:, 5] = story_points / (days_remaining * 24.0)           # hours-normalised pressure
+    raw[:, 6] = days_in / np.maximum(1.0, days_in + days_remaining)
+    if n:
+        raw[:, 7:9] = [_prod_codes(d.ui_type, d.ui_prio) for d in ds]
 
     # Apply the real StandardScaler from productivity_artifacts.pkl
-    if _prod_scaler is not None:
+    if _prod_affine is not None:
+        mean, scale = _prod_affine
+        # In place on the row buffer: no temporaries, stays float32, and
+        # bit-identical to _prod_scaler.transform
+        np.subtract(raw, mean, out=raw)
+        np.divide(raw, scale, out=raw)
+    elif _prod_scaler is not None and n:
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
             raw = _prod_scaler.transform(raw).astype(np.float32)  # Ensure float32 after scaler
@@ -377,12 +612,13 @@ def build_productivity_features(
         raw = ((raw - scaler_mean) / np.where(scaler_scale == 0, 1.0, scaler_scale)).astype(np.float32)
 
     # Validate shape and dtype
-    assert raw.shape == (1, 9), f"Expected shape (1, 9), got {raw.shape}"
+    assert raw.shape == (n, 9), f"Expected shape ({n}, 9), got {raw.shape}"
     assert raw.dtype == np.float32, f"Expected dtype float32, got {raw.dtype}"
     
     # Log to terminal for visibility
-    print(f"[BUILD_PRODUCTIVITY_FEATURES] Shape: {raw.shape}, dtype: {raw.dtype}", file=sys.stderr)
-    print(f"[BUILD_PRODUCTIVITY_FEATURES] Values: {raw[0]}", file=sys.stderr)
+    logger.debug("[BUILD_PRODUCTIVITY_FEATURES] Shape: %s, dtype: %s", raw.shape, raw.dtype)
+    if n == 1:
+        logger.debug("[BUILD_PRODUCTIVITY_FEATURES] Values: %s", raw[0])
     
     return raw
 
@@ -391,7 +627,9 @@ def build_productivity_features(
 # 4. Quality features  (6 features for TabNet, input_dim=6)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def build_quality_features(item_data: dict, sprint_context: dict) -> np.ndarray:
+def build_quality_features(
+    item_data: dict, sprint_context: dict, derived: _Derived = None, out: np.ndarray = None,
+) -> np.ndarray:
     """
     6 features for TabNet quality classifier — MIN-MAX NORMALISED to [0,1].
     
@@ -413,40 +651,47 @@ def build_quality_features(item_data: dict, sprint_context: dict) -> np.ndarray:
 
     le_prio_quality: ['High'=0,'Highest'=1,'Low'=2,'Lowest'=3,'Medium'=4]
     UI map: Low->Low(2), Medium->Medium(4), High->High(0), Critical->Highest(1)
+
+    ``out`` optionally supplies a (1, 6) float32 buffer to fill and return.
     """
-    story_points  = float(item_data.get('story_points', 5))
-    ui_prio       = item_data.get('priority', 'Medium')
-    description   = item_data.get('description', '')
-
-    days_remaining  = float(max(1, sprint_context.get('days_remaining', 14)))
-    sprint_progress = float(sprint_context.get('sprint_progress', 0.0))
-
-    prio_label = _ui_prio_to_quality(ui_prio)
-    prio_code  = float(_safe_le_transform(_quality_le_prio, prio_label))
-
-    prio_norm       = prio_code / 4.0
-    desc_complexity = min(float(len(description)) / 500.0, 1.0)
-    pressure_norm   = story_points / (days_remaining * 14.0)
-    days_norm       = min(days_remaining / 14.0, 1.0)
-    sp_norm         = min(max((story_points - 1.0) / 12.0, 0.0), 1.0)
-
-    # CRITICAL: dtype=np.float32 (NOT float64) and 2D shape (1, 6)
-    X = np.array([[
-        prio_norm,       # [0] prio_code/4
-        desc_complexity, # [1] desc length/500
-        pressure_norm,   # [2] sp/(days*14)
-        days_norm,       # [3] days_rem/14
-        sp_norm,         # [4] (sp-1)/12
-        sprint_progress, # [5] raw 0-1
-    ]], dtype=np.float32)
+    return build_quality_features_batch(
+        [item_data], sprint_context, derived=[derived] if derived else None, out=out)
+
+
+def build_quality_features_batch(
+    items: list, sprint_context: dict, derived: list = None, out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Column-wise form of build_quality_features: an (N, 6) float32 matrix for
+    many items sharing one sprint context, ready for one predict_proba call.
+    """
+    n  = len(items)
+    ds = _derive_batch(items, sprint_context, derived)
+
+    story_points   = np.fromiter((d.story_points   for d in ds), dtype=np.float64, count=n)
+    days_remaining = np.fromiter((d.days_remaining for d in ds), dtype=np.float64, count=n)
+    desc_len       = np.fromiter((d.desc_len       for d in ds), dtype=np.float64, count=n)
+    prio_code      = np.fromiter(
+        (_encode_label(_ui_prio_to_quality(d.ui_prio), _quality_prio_codes) for d in ds),
+        dtype=np.float64, count=n)
+
+    # CRITICAL: dtype=np.float32 (NOT float64) and 2D shape (N, 6)
+    X = np.empty((n, 6), dtype=np.float32) if out is None else out
+    X[:, 0] = prio_code / 4.0                                    # prio_code/4
+    X[:, 1] = np.minimum(desc_len / 500.0, 1.0)                  # desc length/500
+    X[:, 2] = story_points / (days_remaining * 14.0)             # sp/(days*14)
+    X[:, 3] = np.minimum(days_remaining / 14.0, 1.0)             # days_rem/14
+    X[:, 4] = np.clip((story_points - 1.0) / 12.0, 0.0, 1.0)     # (sp-1)/12
+    X[:, 5] = float(sprint_context.get('sprint_progress', 0.0))  # raw 0-1
     
     # Validate shape and dtype before returning
-    assert X.shape == (1, 6), f"Expected shape (1, 6), got {X.shape}"
+    assert X.shape == (n, 6), f"Expected shape ({n}, 6), got {X.shape}"
     assert X.dtype == np.float32, f"Expected dtype float32, got {X.dtype}"
     
     # Log to terminal for visibility
-    print(f"[BUILD_QUALITY_FEATURES] Shape: {X.shape}, dtype: {X.dtype}", file=sys.stderr)
-    print(f"[BUILD_QUALITY_FEATURES] Values: {X[0]}", file=sys.stderr)
+    logger.debug("[BUILD_QUALITY_FEATURES] Shape: %s, dtype: %s", X.shape, X.dtype)
+    if n == 1:
+        logger.debug("[BUILD_QUALITY_FEATURES] Values: %s", X[0])
     
     return X
 
@@ -482,17 +727,38 @@ class FeatureEngineer:
             'team_velocity_14d':        sprint_context.get('team_velocity_14d', 30),
         }
 
-    def prepare_for_effort_model(self, features_dict, item_data, sprint_context):
-        return build_effort_features(item_data, sprint_context)
-
-    def prepare_for_schedule_risk_model(self, item_data, sprint_context):
-        return build_schedule_risk_features(item_data, sprint_context)
-
-    def prepare_for_quality_risk_model(self, item_data, sprint_context):
-        return build_quality_features(item_data, sprint_context)
-
-    def prepare_for_productivity_model(self, item_data, sprint_context):
-        return build_productivity_features(item_data, sprint_context)
+    def extract_all(self, item_data, sprint_context):
+        """
+        Everything predict_all_impacts needs from the raw inputs, in one call:
+        ``(features, derived)`` — the summary dict returned to the frontend
+        and the _Derived scalars passed to every build_* builder.
+
+        Malformed inputs never raise here: ``features`` falls back to {} and
+        ``derived`` to None, so each builder re-derives and fails into its
+        own model's fallback.
+        """
+        try:
+            features = self.extract_features(item_data, sprint_context)
+        except Exception as e:
+            logger.warning("[ERROR] Feature extraction failed: %s", e)
+            features = {}
+        try:
+            derived = derive_features(item_data, sprint_context)
+        except (TypeError, ValueError):
+            derived = None
+        return features, derived
+
+    def prepare_for_effort_model(self, features_dict, item_data, sprint_context, derived=None):
+        return build_effort_features(item_data, sprint_context, derived=derived)
+
+    def prepare_for_schedule_risk_model(self, item_data, sprint_context, derived=None):
+        return build_schedule_risk_features(item_data, sprint_context, derived=derived)
+
+    def prepare_for_quality_risk_model(self, item_data, sprint_context, derived=None):
+        return build_quality_features(item_data, sprint_context, derived=derived)
+
+    def prepare_for_productivity_model(self, item_data, sprint_context, derived=None):
+        return build_productivity_features(item_data, sprint_context, derived=derived)
 
 
 feature_engineer = FeatureEngineer()
\ No newline at end of file
@@ -4,20 +4,31 @@ impact_predictor.py
 Runs all 4 model predictions and formats results for the frontend.
 Productivity uses a hybrid XGBoost + MLP ensemble (averaged output).
 """
-import sys
-import io
-import traceback
+import os
+import bisect
+import threading
+import functools
+import importlib.util
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 import numpy as np
-import pandas as pd
-from typing import Dict, Any, Optional
+import orjson
+from typing import List, Optional
 
 from model_loader import model_loader
 from feature_engineering import (
     feature_engineer,
+    EFFORT_COLS,
     build_effort_features,
+    build_effort_features_batch,
     build_schedule_risk_features,
+    build_schedule_risk_features_batch,
     build_quality_features,
+    build_quality_features_batch,
     build_productivity_features,
+    build_productivity_features_batch,
 )
 
 try:
@@ -26,17 +37,30 @@ try:
 except ImportError:
     TORCH_AVAILABLE = False
 
-try:
-    import xgboost as xgb
-    XGBOOST_AVAILABLE = True
-except ImportError:
-    XGBOOST_AVAILABLE = False
+# The loaded Boosters are scored with their own inplace_predict, so xgboost
+# itself is never imported here; only its presence gates the XGB component
+XGBOOST_AVAILABLE = importlib.util.find_spec('xgboost') is not None
+
+
+logger = logging.getLogger(__name__)
+
+# The four models are independent, so predict_all_impacts scores them side by
+# side.  Booster.inplace_predict and torch inference release the GIL, and every
+# booster is pinned to nthread=1 by model_loader, so four calls fill at most
+# four cores.  IMPACT_PARALLEL_PREDICT=0 runs them sequentially instead; that
+# is the default under several server workers (WEB_CONCURRENCY > 1), where
+# the worker processes already occupy the cores and a per-process pool on top
+# would oversubscribe them.
+_WORKERS = max(1, int(os.environ.get('WEB_CONCURRENCY', '1')))
+_PARALLEL_PREDICT = os.environ.get('IMPACT_PARALLEL_PREDICT', '1' if _WORKERS == 1 else '0') != '0'
+_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='impact-predict') if _PARALLEL_PREDICT else None
 
 
 # Label map from risk_artifacts.pkl
 # Label inversion fix: class 0 is the benign (most-predicted) outcome.
 #   0 = Low Risk  |  1 = Medium Risk  |  2 = High Risk  |  3 = Critical Risk
-SCHEDULE_LABEL_MAP = {0: 'Low Risk', 1: 'Medium Risk', 2: 'High Risk', 3: 'Critical Risk'}
+# Indexed by class code; tuples rather than dicts keep the per-predict lookups cheap
+SCHEDULE_LABELS = ('Low Risk', 'Medium Risk', 'High Risk', 'Critical Risk')
 
 # Weighted midpoints for schedule risk scoring.
 # The XGBoost model rarely outputs class 2 or 3 probabilities above 0.1%,
@@ -46,15 +70,141 @@ SCHEDULE_LABEL_MAP = {0: 'Low Risk', 1: 'Medium Risk', 2: 'High Risk', 3: 'Criti
 #   High (2) → centre 65%  Critical (3) → centre 90%
 # This maps the model's dominant-class prediction to a human-readable
 # spillover % that varies meaningfully across inputs.
-SCHEDULE_CLASS_MIDPOINTS = {0: 5.0, 1: 30.0, 2: 65.0, 3: 90.0}
+SCHEDULE_CLASS_MIDPOINTS = (5.0, 30.0, 65.0, 90.0)
+
+# Quantile boosters scored on the same effort row, in (lower, median, upper) order
+_EFFORT_VARIANTS = ('effort_lower', 'effort_median', 'effort_upper')
+
+# Marks _fallback_* results (a model missing or failing inside _predict_*) so
+# they count towards using_heuristic and are never memoised
+_FALLBACK_FLAG = "ML_FAILED_USING_FALLBACK"
 
 _DEFAULT_FOCUS_HOURS = 6.0   # fallback; real value comes from Space.focus_hours_per_day
 
+# Representative input for ImpactPredictor.warm_up
+_WARMUP_ITEM = {
+    'title': 'Warm-up item', 'description': 'Warm-up description',
+    'type': 'Story', 'priority': 'Medium', 'story_points': 3,
+}
+_WARMUP_CONTEXT = {'days_remaining': 7, 'days_since_sprint_start': 7,
+                   'sprint_load_7d': 20, 'team_velocity_14d': 30}
+
 
 def _cap(v: float, lo: float = 0.0, hi: float = 99.0) -> float:
     return round(max(lo, min(hi, v)), 1)
 
 
+def _days_remaining(ctx: dict) -> int:
+    """Days left in the sprint, floored at 1 so per-day rates stay finite."""
+    return max(1, ctx.get('days_remaining', 14))
+
+
+def _cap_arr(a: np.ndarray, lo: float = 0.0, hi: float = 99.0) -> np.ndarray:
+    """
+    Element-wise _cap for batch paths: one clip and one round per array.
+    NaN maps to ``hi``, as max(lo, min(hi, nan)) does in the scalar form.
+    """
+    return np.round(np.clip(np.nan_to_num(a, nan=hi), lo, hi), 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_sprint_date(value: str) -> datetime:
+    """
+    ISO date/datetime string → naive UTC datetime.  A sprint's start/end
+    strings repeat on every predict, so each distinct value is parsed once.
+    """
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+@functools.lru_cache(maxsize=256)
+def _sprint_window(start, end, minute: int) -> tuple:
+    """
+    (days_since_sprint_start, days_remaining, sprint_progress) for a sprint
+    as of the start of the given UTC minute.  Every item scored against the
+    same sprint within that minute shares one computation.
+    """
+    if isinstance(start, str): start = _parse_sprint_date(start)
+    if isinstance(end,   str): end   = _parse_sprint_date(end)
+    now = datetime.fromtimestamp(minute * 60, timezone.utc).replace(tzinfo=None)
+    days_since = max(0, (now - start).days)
+    total = max(1, (end - start).days)
+    return days_since, max(0, (end - now).days), days_since / total
+
+
+# ── Display templates ─────────────────────────────────────────────────────────
+# (status, label, sub_text template) per band; filled with one format_map call
+_EFF_CRITICAL = ('critical', 'Sprint Overload',
+                 "Needs {h:.0f}h but only {r:.0f}h remain ({f:.0f}h/day). Cannot finish in this sprint.")
+_EFF_WARNING  = ('warning', 'Tight Fit',
+                 "Needs {h:.0f}h with {r:.0f}h remaining ({f:.0f}h/day). Very little buffer.")
+_EFF_SAFE     = ('safe', 'Fits in Sprint',
+                 "Needs {h:.0f}h with {r:.0f}h remaining ({f:.0f}h/day). Fits comfortably.")
+
+_SCH_CRITICAL = ('critical', 'Delay Imminent',
+                 "{p:.0f}% chance of spillover. Sprint goal is in danger. Consider deferring or swapping.")
+_SCH_WARNING  = ('warning', 'Moderate Risk', "{p:.0f}% chance of spillover. Monitor closely.")
+_SCH_SAFE     = ('safe', 'On Track', "{p:.0f}% chance of spillover. Likely to finish on time.")
+
+_PRD_CRITICAL = ('critical', 'High Drag',
+                 "Context switching to this task will seriously disrupt team velocity. "
+                 "Approximately {p:.0f}% slowdown expected on remaining backlog.")
+_PRD_WARNING  = ('warning', 'Negative',
+                 "Context switching to this task will slow down the remaining "
+                 "backlog items by approximately {p:.0f}%.")
+_PRD_SAFE     = ('safe', 'Minimal Impact',
+                 "Adding this task has minimal impact on team flow. "
+                 "Estimated {p:.0f}% slowdown on remaining backlog.")
+
+_QUA_CRITICAL = ('critical', 'High Bug Risk', "{p:.0f}% defect likelihood. Double QA time recommended.")
+_QUA_WARNING  = ('warning', 'Elevated Risk', "{p:.0f}% defect likelihood. Additional review cycle advised.")
+_QUA_SAFE     = ('safe', 'Standard Risk', "{p:.0f}% defect likelihood. Standard testing required.")
+
+# Bands in ascending severity with the upper-exclusive cut points between
+# them: bisect_left(bins, x) == number of cuts x strictly exceeds, which is
+# exactly the original `x > hi ... elif x > lo` ladder
+_EFF_BANDS = (_EFF_SAFE, _EFF_WARNING, _EFF_CRITICAL)   # cuts: 0.8·remaining, remaining
+_SCH_BANDS, _SCH_BINS = (_SCH_SAFE, _SCH_WARNING, _SCH_CRITICAL), (30, 50)
+_PRD_BANDS, _PRD_BINS = (_PRD_SAFE, _PRD_WARNING, _PRD_CRITICAL), (10, 30)
+_QUA_BANDS, _QUA_BINS = (_QUA_SAFE, _QUA_WARNING, _QUA_CRITICAL), (30, 60)
+
+# Raw schedule-risk result uses its own labels on the display's cut points
+_SCH_STATUS = (('safe', 'Low Risk'), ('warning', 'Moderate Risk'), ('critical', 'High Risk'))
+
+# ── Summary scoring ───────────────────────────────────────────────────────────
+# Risk points per band (index = bisect over the band cuts above)
+_EFFORT_STATUS_POINTS = {'critical': 3, 'warning': 2}
+_SCH_POINTS = (0, 2, 3)
+_PRD_POINTS = (0, 1, 2)
+_QUA_POINTS = (0, 1, 2)
+
+# Risk appetite → (split, swap, defer) minimum scores; bisect_right(cuts, score)
+# indexes _SUMMARY_TIERS.  Strict is most conservative, Lenient most permissive.
+_APPETITE_CUTS = {
+    "Strict":   (1, 3, 5),
+    "Standard": (2, 4, 7),
+    "Lenient":  (3, 6, 9),
+}
+_SUMMARY_TIERS = (('low', 'ADD'), ('medium', 'SPLIT'), ('high', 'SWAP'), ('critical', 'DEFER'))
+
+_EFF_VALUE = "{h:.0f}h / {r:.0f}h Remaining"
+_SCH_VALUE = "{p:.0f}% Probability of Spillover"
+_PRD_VALUE = "-{p:.0f}% Drop"
+_QUA_VALUE = "{p:.0f}% Defect Risk"
+
+
+def _display_entry(band: tuple, value_tmpl: str, fields: dict) -> dict:
+    status, label, sub_tmpl = band
+    return {
+        'value':    value_tmpl.format_map(fields),
+        'label':    label,
+        'status':   status,
+        'sub_text': sub_tmpl.format_map(fields),
+    }
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 def generate_display_metrics(
     eff: dict, sched: dict, prod: dict, qual: dict,
@@ -62,101 +212,138 @@ def generate_display_metrics(
     focus_hours_per_day: float = _DEFAULT_FOCUS_HOURS,
 ) -> dict:
     """Convert raw prediction dicts into frontend-ready display objects."""
-    days_remaining  = max(1, sprint_context.get('days_remaining', 14))
+    days_remaining  = _days_remaining(sprint_context)
     hours_remaining = days_remaining * focus_hours_per_day
 
     # ── Effort ────────────────────────────────────────────────────────────────
     predicted_hours = eff.get('hours_median', 0.0)
-    if predicted_hours > hours_remaining:
-        eff_status, eff_label = 'critical', 'Sprint Overload'
-        eff_sub = (f"Needs {predicted_hours:.0f}h but only {hours_remaining:.0f}h remain "
-                   f"({focus_hours_per_day:.0f}h/day). Cannot finish in this sprint.")
-    elif predicted_hours > hours_remaining * 0.8:
-        eff_status, eff_label = 'warning', 'Tight Fit'
-        eff_sub = (f"Needs {predicted_hours:.0f}h with {hours_remaining:.0f}h remaining "
-                   f"({focus_hours_per_day:.0f}h/day). Very little buffer.")
-    else:
-        eff_status, eff_label = 'safe', 'Fits in Sprint'
-        eff_sub = (f"Needs {predicted_hours:.0f}h with {hours_remaining:.0f}h remaining "
-                   f"({focus_hours_per_day:.0f}h/day). Fits comfortably.")
+    eff_band = _EFF_BANDS[bisect.bisect_left((hours_remaining * 0.8, hours_remaining), predicted_hours)]
 
     # ── Schedule Risk ─────────────────────────────────────────────────────────
     spillover_pct = _cap(sched.get('probability', 0.0))
-    if spillover_pct > 50:
-        sch_status, sch_label = 'critical', 'Delay Imminent'
-        sch_sub = (f"{spillover_pct:.0f}% chance of spillover. Sprint goal is in danger. "
-                   "Consider deferring or swapping.")
-    elif spillover_pct > 30:
-        sch_status, sch_label = 'warning', 'Moderate Risk'
-        sch_sub = f"{spillover_pct:.0f}% chance of spillover. Monitor closely."
-    else:
-        sch_status, sch_label = 'safe', 'On Track'
-        sch_sub = f"{spillover_pct:.0f}% chance of spillover. Likely to finish on time."
+    sch_band = _SCH_BANDS[bisect.bisect_left(_SCH_BINS, spillover_pct)]
 
     # ── Productivity ──────────────────────────────────────────────────────────
-    velocity_change  = prod.get('velocity_change', 0.0)
-    days_lost        = prod.get('days_lost', 0.0)
-    drop_pct         = prod.get('drop_pct', abs(prod.get('velocity_change', 0.0)))
-    drag_pct         = _cap(drop_pct, hi=99.0)
-
-    if drag_pct > 30:
-        prd_status, prd_label = 'critical', 'High Drag'
-        prd_sub = (f"Context switching to this task will seriously disrupt team velocity. "
-                   f"Approximately {drag_pct:.0f}% slowdown expected on remaining backlog.")
-    elif drag_pct > 10:
-        prd_status, prd_label = 'warning', 'Negative'
-        prd_sub = (f"Context switching to this task will slow down the remaining "
-                   f"backlog items by approximately {drag_pct:.0f}%.")
-    else:
-        prd_status, prd_label = 'safe', 'Minimal Impact'
-        prd_sub = (f"Adding this task has minimal impact on team flow. "
-                   f"Estimated {drag_pct:.0f}% slowdown on remaining backlog.")
+    drop_pct = prod.get('drop_pct', abs(prod.get('velocity_change', 0.0)))
+    drag_pct = _cap(drop_pct, hi=99.0)
+    prd_band = _PRD_BANDS[bisect.bisect_left(_PRD_BINS, drag_pct)]
 
     # ── Quality ───────────────────────────────────────────────────────────────
     defect_pct = _cap(qual.get('probability', 0.0))
-    if defect_pct > 60:
-        qua_status, qua_label = 'critical', 'High Bug Risk'
-        qua_sub = f"{defect_pct:.0f}% defect likelihood. Double QA time recommended."
-    elif defect_pct > 30:
-        qua_status, qua_label = 'warning', 'Elevated Risk'
-        qua_sub = f"{defect_pct:.0f}% defect likelihood. Additional review cycle advised."
-    else:
-        qua_status, qua_label = 'safe', 'Standard Risk'
-        qua_sub = f"{defect_pct:.0f}% defect likelihood. Standard testing required."
+    qua_band = _QUA_BANDS[bisect.bisect_left(_QUA_BINS, defect_pct)]
 
     return {
-        'effort': {
-            'value':    f"{predicted_hours:.0f}h / {hours_remaining:.0f}h Remaining",
-            'label':    eff_label,
-            'status':   eff_status,
-            'sub_text': eff_sub,
-        },
-        'schedule': {
-            'value':    f"{spillover_pct:.0f}% Probability of Spillover",
-            'label':    sch_label,
-            'status':   sch_status,
-            'sub_text': sch_sub,
-        },
-        'productivity': {
-            'value':    f"-{drag_pct:.0f}% Drop",
-            'label':    prd_label,
-            'status':   prd_status,
-            'sub_text': prd_sub,
-        },
-        'quality': {
-            'value':    f"{defect_pct:.0f}% Defect Risk",
-            'label':    qua_label,
-            'status':   qua_status,
-            'sub_text': qua_sub,
-        },
+        'effort':       _display_entry(eff_band, _EFF_VALUE,
+                                       {'h': predicted_hours, 'r': hours_remaining, 'f': focus_hours_per_day}),
+        'schedule':     _display_entry(sch_band, _SCH_VALUE, {'p': spillover_pct}),
+        'productivity': _display_entry(prd_band, _PRD_VALUE, {'p': drag_pct}),
+        'quality':      _display_entry(qua_band, _QUA_VALUE, {'p': defect_pct}),
     }
 
 
+def generate_display_metrics_batch(
+    effs: list, scheds: list, prods: list, quals: list,
+    sprint_context: dict,
+    focus_hours_per_day: float = _DEFAULT_FOCUS_HOURS,
+) -> list:
+    """
+    generate_display_metrics for many items sharing one sprint context.  Each
+    metric is capped and banded as a whole array (np.searchsorted over the
+    same cut points as the scalar bisect), so only the string formatting
+    remains per item.  Raises on any malformed prediction dict; callers fall
+    back to the per-item form.
+    """
+    n = len(effs)
+    days_remaining  = _days_remaining(sprint_context)
+    hours_remaining = days_remaining * focus_hours_per_day
+
+    hours  = np.fromiter((e.get('hours_median', 0.0) for e in effs), dtype=np.float64, count=n)
+    spill  = _cap_arr(np.fromiter((s.get('probability', 0.0) for s in scheds), dtype=np.float64, count=n))
+    drag   = _cap_arr(np.fromiter(
+        (p.get('drop_pct', abs(p.get('velocity_change', 0.0))) for p in prods), dtype=np.float64, count=n))
+    defect = _cap_arr(np.fromiter((q.get('probability', 0.0) for q in quals), dtype=np.float64, count=n))
+
+    eff_idx = np.searchsorted((hours_remaining * 0.8, hours_remaining), hours).tolist()
+    sch_idx = np.searchsorted(_SCH_BINS, spill).tolist()
+    prd_idx = np.searchsorted(_PRD_BINS, drag).tolist()
+    qua_idx = np.searchsorted(_QUA_BINS, defect).tolist()
+
+    return [
+        {
+            'effort':       _display_entry(_EFF_BANDS[ei], _EFF_VALUE,
+                                           {'h': h, 'r': hours_remaining, 'f': focus_hours_per_day}),
+            'schedule':     _display_entry(_SCH_BANDS[si], _SCH_VALUE, {'p': sp}),
+            'productivity': _display_entry(_PRD_BANDS[pi], _PRD_VALUE, {'p': dp}),
+            'quality':      _display_entry(_QUA_BANDS[qi], _QUA_VALUE, {'p': qp}),
+        }
+        for h, sp, dp, qp, ei, si, pi, qi in zip(
+            hours.tolist(), spill.tolist(), drag.tolist(), defect.tolist(),
+            eff_idx, sch_idx, prd_idx, qua_idx)
+    ]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 class ImpactPredictor:
 
+    # Bounded LRU of full ML results; the UI re-requests the same ticket
+    # against the same sprint many times while the user toggles views
+    _CACHE_SIZE = 4096
+
     def __init__(self):
         self.models = model_loader.models
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()   # routes predict from threadpool workers
+        self._local = threading.local()
+        self.refresh_models()
+
+    def _row_buffers(self) -> dict:
+        """
+        Per-thread single-row feature buffers, reused by every predict on that
+        thread instead of allocating fresh rows per model per request.  The
+        models copy their input, so a buffer is free again once predict returns.
+        """
+        bufs = getattr(self._local, 'bufs', None)
+        if bufs is None:
+            bufs = self._local.bufs = {
+                'effort':       np.empty((1, len(EFFORT_COLS)), dtype=np.float32),
+                'quality':      np.empty((1, 6), dtype=np.float32),
+                'productivity': np.empty((1, 9), dtype=np.float32),
+            }
+        return bufs
+
+    def refresh_models(self) -> None:
+        """
+        Bind the loaded models to attributes so the predict paths skip the
+        per-call dict lookups.  The models are loaded after this singleton is
+        created (main.py lifespan), so call this again after every
+        model_loader.load_all_models(); it also drops cached results computed
+        by the previous models.
+        """
+        m = self.models
+        effort = tuple(m.get(name) for name in _EFFORT_VARIANTS)
+        self._m_effort   = effort if all(x is not None for x in effort) else None
+        self._m_sched    = m.get('schedule_risk')
+        self._m_qual     = m.get('quality_risk')
+        self._m_prod_xgb = m.get('productivity_xgb') if XGBOOST_AVAILABLE else None
+        self._m_prod_nn  = m.get('productivity_nn') if TORCH_AVAILABLE else None
+        with self._cache_lock:
+            self._cache.clear()
+
+    def warm_up(self) -> None:
+        """
+        Run throwaway predictions through every loaded model so first-call
+        costs (xgboost predictor setup, torch/TabNet kernel selection) are
+        paid at startup, not by the first request.  Both the single-row and
+        the multi-row batch shapes are exercised, which also starts the
+        prediction pool's worker threads.
+        Bypasses the result cache.
+        """
+        try:
+            self._predict_all_impacts(_WARMUP_ITEM, self._enrich_context(_WARMUP_CONTEXT),
+                                      _DEFAULT_FOCUS_HOURS, "Standard")
+            self.predict_all_impacts_batch([_WARMUP_ITEM, _WARMUP_ITEM], _WARMUP_CONTEXT)
+        except Exception as e:
+            logger.warning("Model warm-up failed: %s", e)
 
     def predict_all_impacts(
         self,
@@ -171,58 +358,179 @@ class ImpactPredictor:
         
         If ML models fail, falls back to heuristic-based estimates.
         Returns always include a confidence score and error flag if fallback was used.
+
+        Results are memoised on the inputs and the enriched sprint context,
+        whose _sprint_window fields are its only time-dependent part; they
+        roll over at the sprint's own start/end times, not at UTC midnight,
+        so keying on them expires entries exactly when the inputs change.
+        Results containing any heuristic or _fallback_* metric (error_flag
+        set) are not cached, so a one-off model failure is never replayed to
+        later requests.
         """
         ctx = self._enrich_context(sprint_context)
-        
-        # Try to use ML models with graceful fallback
-        try:
-            effort = self._predict_effort(item_data, ctx, focus_hours_per_day)
-        except Exception as e:
-            print(f"[ERROR] Effort prediction failed, using heuristic: {e}")
-            effort = self._heuristic_effort(item_data, ctx, focus_hours_per_day)
-            effort["error_flag"] = "ML_FAILED_USING_HEURISTIC"
-        
-        try:
-            schedule = self._predict_schedule_risk(item_data, ctx)
-        except Exception as e:
-            print(f"[ERROR] Schedule risk prediction failed, using heuristic: {e}")
-            schedule = self._heuristic_schedule_risk(item_data, ctx)
-            schedule["error_flag"] = "ML_FAILED_USING_HEURISTIC"
-        
         try:
-            quality = self._predict_quality_risk(item_data, ctx)
-        except Exception as e:
-            print(f"[ERROR] Quality risk prediction failed, using heuristic: {e}")
-            quality = self._heuristic_quality_risk(item_data, ctx)
-            quality["error_flag"] = "ML_FAILED_USING_HEURISTIC"
+            key = orjson.dumps(
+                (item_data, ctx, focus_hours_per_day, risk_appetite),
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            )
+        except TypeError:   # unserialisable input — predict without caching
+            return self._predict_all_impacts(item_data, ctx, focus_hours_per_day, risk_appetite)
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is None:
+            # Predict outside the lock; concurrent misses on one key just
+            # compute the same result twice
+            cached = self._predict_all_impacts(item_data, ctx, focus_hours_per_day, risk_appetite)
+            if cached['using_heuristic']:
+                return cached
+            with self._cache_lock:
+                self._cache[key] = cached
+                if len(self._cache) > self._CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        # Callers annotate the display entries (the saturation guard rewrites
+        # display.productivity), so each caller gets its own copies of those;
+        # the rest of the cached result is shared read-only
+        result = dict(cached)
+        result['display'] = {k: dict(v) if isinstance(v, dict) else v
+                             for k, v in cached['display'].items()}
+        return result
+
+    def _predict_all_impacts(
+        self,
+        item_data: dict,
+        ctx: dict,
+        focus_hours_per_day: float,
+        risk_appetite: str,
+    ) -> dict:
+        """Uncached predict_all_impacts over an already-enriched context."""
+        # Summary features and the scalars shared by all four feature
+        # builders come from one pass over the inputs
+        features, derived = feature_engineer.extract_all(item_data, ctx)
         
+        # Try to use ML models with graceful fallback
+        effort, schedule, quality, productivity = self._run_models(
+            functools.partial(self._safe_predict, "Effort", self._predict_effort,
+                              lambda: self._heuristic_effort(item_data, ctx, focus_hours_per_day),
+                              item_data, ctx, focus_hours_per_day, derived=derived),
+            functools.partial(self._safe_predict, "Schedule risk", self._predict_schedule_risk,
+                              lambda: self._heuristic_schedule_risk(item_data, ctx),
+                              item_data, ctx, derived=derived),
+            functools.partial(self._safe_predict, "Quality risk", self._predict_quality_risk,
+                              lambda: self._heuristic_quality_risk(item_data, ctx),
+                              item_data, ctx, derived=derived),
+            functools.partial(self._safe_predict, "Productivity", self._predict_productivity,
+                              lambda: self._heuristic_productivity(item_data, ctx),
+                              item_data, ctx, derived=derived),
+        )
+
+        return self._assemble_result(
+            ctx, features, effort, schedule, quality, productivity,
+            focus_hours_per_day, risk_appetite)
+
+    def predict_all_impacts_batch(
+        self,
+        items: List[dict],
+        sprint_context: dict,
+        focus_hours_per_day: float = _DEFAULT_FOCUS_HOURS,
+        risk_appetite: str = "Standard",
+    ) -> List[dict]:
+        """
+        Batch form of predict_all_impacts for many backlog items sharing one
+        sprint.  Feature rows are stacked per model so each model is invoked
+        once for the whole batch instead of once per item.  If a model fails
+        on the batch, that model falls back to the per-item path (and its
+        heuristics) so one bad row cannot sink the rest.
+        """
+        if not items:
+            return []
+        # One private copy, enriched in place and shared read-only by every
+        # item and model below
+        ctx = self._enrich_context_mut(dict(sprint_context))
+        features, derived = zip(*(feature_engineer.extract_all(it, ctx) for it in items))
+
+        efforts, schedules, qualities, productivities = self._run_models(
+            functools.partial(self._predict_effort_batch, items, ctx, focus_hours_per_day, derived),
+            functools.partial(self._predict_schedule_risk_batch, items, ctx, derived),
+            functools.partial(self._predict_quality_risk_batch, items, ctx, derived),
+            functools.partial(self._predict_productivity_batch, items, ctx, derived),
+        )
+
         try:
-            productivity = self._predict_productivity(item_data, ctx)
+            displays = generate_display_metrics_batch(
+                efforts, schedules, productivities, qualities, ctx, focus_hours_per_day)
         except Exception as e:
-            print(f"[ERROR] Productivity prediction failed, using heuristic: {e}")
-            productivity = self._heuristic_productivity(item_data, ctx)
-            productivity["error_flag"] = "ML_FAILED_USING_HEURISTIC"
-        
-        # Summary and display metrics can use the above (even if from heuristic)
+            logger.warning("[DISPLAY BATCH] %s: %s — formatting per item", type(e).__name__, e)
+            displays = [None] * len(items)
         try:
-            summary = self._generate_summary(effort, schedule, quality, productivity, risk_appetite)
+            summaries = self._generate_summary_batch(
+                efforts, schedules, qualities, productivities, risk_appetite)
         except Exception as e:
-            print(f"[ERROR] Summary generation failed: {e}")
-            summary = {"recommendation": "DEFER", "reasoning": "Unable to analyze impact. Suggest deferring to next sprint."}
-        
+            logger.warning("[SUMMARY BATCH] %s: %s — summarising per item", type(e).__name__, e)
+            summaries = [None] * len(items)
+
+        return [
+            self._assemble_result(ctx, f, e, s, q, p, focus_hours_per_day, risk_appetite,
+                                  display=d, summary=sm)
+            for f, e, s, q, p, d, sm in zip(
+                features, efforts, schedules, qualities, productivities, displays, summaries)
+        ]
+
+    @staticmethod
+    def _run_models(*calls) -> list:
+        """
+        Results of the given zero-argument model calls, in order.  Each call
+        handles its own fallback, so an exception here is a genuine bug.
+        """
+        if not _PARALLEL_PREDICT:
+            return [call() for call in calls]
+        futures = [_POOL.submit(call) for call in calls]
+        return [f.result() for f in futures]
+
+    def _safe_predict(self, name: str, predict, heuristic, *args, **kwargs) -> dict:
+        """Per-item prediction with the heuristic fallback used by predict_all_impacts."""
         try:
-            display = generate_display_metrics(
-                effort, schedule, productivity, quality,
-                ctx, focus_hours_per_day)
+            return predict(*args, **kwargs)
         except Exception as e:
-            print(f"[ERROR] Display metrics generation failed: {e}")
-            display = {"error": "Display metrics unavailable"}
+            logger.warning("[ERROR] %s prediction failed, using heuristic: %s", name, e)
+            result = heuristic()
+            result["error_flag"] = "ML_FAILED_USING_HEURISTIC"
+            return result
+
+    def _predict_per_item(self, name: str, items, ctx, derived, predict, heuristic, **kwargs) -> list:
+        return [
+            self._safe_predict(name, predict, lambda it=it: heuristic(it, ctx),
+                               it, ctx, derived=d, **kwargs)
+            for it, d in zip(items, derived)
+        ]
+
+    def _assemble_result(
+        self, ctx: dict, features: dict,
+        effort: dict, schedule: dict, quality: dict, productivity: dict,
+        focus_hours_per_day: float, risk_appetite: str,
+        display: Optional[dict] = None,
+        summary: Optional[dict] = None,
+    ) -> dict:
+        # Summary and display metrics can use the above (even if from heuristic);
+        # batch callers pass both precomputed
+        if summary is None:
+            try:
+                summary = self._generate_summary(effort, schedule, quality, productivity, risk_appetite)
+            except Exception as e:
+                logger.warning("[ERROR] Summary generation failed: %s", e)
+                summary = {"recommendation": "DEFER", "reasoning": "Unable to analyze impact. Suggest deferring to next sprint."}
         
-        try:
-            features = feature_engineer.extract_features(item_data, ctx)
-        except Exception as e:
-            print(f"[ERROR] Feature extraction failed: {e}")
-            features = {}
+        if display is None:
+            try:
+                display = generate_display_metrics(
+                    effort, schedule, productivity, quality,
+                    ctx, focus_hours_per_day)
+            except Exception as e:
+                logger.warning("[ERROR] Display metrics generation failed: %s", e)
+                display = {"error": "Display metrics unavailable"}
         
         # Determine overall confidence level
         has_errors = any(m.get("error_flag") for m in [effort, schedule, quality, productivity])
@@ -241,18 +549,19 @@ class ImpactPredictor:
 
     # ── context enrichment ────────────────────────────────────────────────────
     def _enrich_context(self, ctx: dict) -> dict:
-        from datetime import datetime
-        ctx = dict(ctx)
+        """Enriched copy of a caller-owned sprint context."""
+        return self._enrich_context_mut(dict(ctx))
+
+    @staticmethod
+    def _enrich_context_mut(ctx: dict) -> dict:
+        """In-place form of _enrich_context for contexts the predictor owns."""
         start = ctx.get('start_date')
         end   = ctx.get('end_date')
         if start and end:
-            if isinstance(start, str): start = datetime.strptime(start, '%Y-%m-%d')
-            if isinstance(end,   str): end   = datetime.strptime(end,   '%Y-%m-%d')
-            now = datetime.utcnow()
-            ctx['days_since_sprint_start'] = max(0, (now - start).days)
-            ctx['days_remaining']          = max(0, (end - now).days)
-            total = max(1, (end - start).days)
-            ctx['sprint_progress'] = ctx['days_since_sprint_start'] / total
+            minute = int(datetime.now(timezone.utc).timestamp()) // 60
+            (ctx['days_since_sprint_start'],
+             ctx['days_remaining'],
+             ctx['sprint_progress']) = _sprint_window(start, end, minute)
         else:
             ctx.setdefault('days_since_sprint_start', 0)
             ctx.setdefault('days_remaining', 14)
@@ -263,247 +572,309 @@ class ImpactPredictor:
     def _predict_effort(
         self, item_data: dict, sprint_context: dict,
         focus_hours_per_day: float = _DEFAULT_FOCUS_HOURS,
+        derived=None,
     ) -> dict:
+        X = None
         try:
-            feat_dict = build_effort_features(item_data, sprint_context)
-            df        = pd.DataFrame([feat_dict])
-            dmat      = xgb.DMatrix(df)
+            X = build_effort_features(item_data, sprint_context, derived=derived,
+                                      out=self._row_buffers()['effort'])
 
-            lower  = float(self.models['effort_lower'].predict(dmat)[0])
-            median = float(self.models['effort_median'].predict(dmat)[0])
-            upper  = float(self.models['effort_upper'].predict(dmat)[0])
-
-            # Ensure ordering
-            lower, upper = min(lower, median), max(upper, median)
+            # inplace_predict scores the contiguous float32 row directly,
+            # skipping the per-call DMatrix construction and copy; all three
+            # quantile boosters share that one row
+            lower, median, upper = (
+                float(m.inplace_predict(X)[0]) for m in self._effort_models()
+            )
+            return self._format_effort(lower, median, upper, sprint_context, focus_hours_per_day)
+        except Exception as e:
+            logger.exception("[EFFORT PREDICTION ERROR] %s: %s", type(e).__name__, e)
+            if X is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Features attempted: %s", dict(zip(EFFORT_COLS, X[0].tolist())))
+            return self._fallback_effort(item_data, sprint_context, focus_hours_per_day)
 
-            days_remaining  = max(1, sprint_context.get('days_remaining', 14))
-            hours_remaining = days_remaining * focus_hours_per_day
+    def _effort_models(self) -> tuple:
+        if self._m_effort is None:
+            raise KeyError("effort quantile models not loaded")
+        return self._m_effort
 
-            if median > hours_remaining:
-                status, label = 'critical', 'Sprint Overload'
-            elif median > hours_remaining * 0.8:
-                status, label = 'warning', 'Tight Fit'
-            else:
-                status, label = 'safe', 'Fits in Sprint'
+    def _sched_model(self):
+        if self._m_sched is None:
+            raise KeyError("schedule_risk")
+        return self._m_sched
 
-            return {
-                'hours_lower':     round(lower, 1),
-                'hours_median':    round(median, 1),
-                'hours_upper':     round(upper, 1),
-                'hours_remaining': round(hours_remaining, 1),
-                'status':          status,
-                'status_label':    label,
-                'explanation':     f"Predicted {median:.1f}h vs {hours_remaining:.0f}h remaining.",
-            }
+    def _predict_effort_batch(self, items, ctx, focus_hours_per_day, derived) -> list:
+        try:
+            X = build_effort_features_batch(items, ctx, derived=derived)
+            lowers, medians, uppers = (
+                m.inplace_predict(X).tolist() for m in self._effort_models()
+            )
         except Exception as e:
-            print(f"\n[EFFORT PREDICTION ERROR] {type(e).__name__}: {e}")
-            traceback.print_exc()
-            print(f"[DEBUG] Features attempted: {feat_dict}\n")
-            return self._fallback_effort(item_data, sprint_context, focus_hours_per_day)
+            logger.warning("[EFFORT BATCH] %s: %s — scoring per item", type(e).__name__, e)
+            return self._predict_per_item(
+                "Effort", items, ctx, derived, self._predict_effort,
+                lambda it, c: self._heuristic_effort(it, c, focus_hours_per_day),
+                focus_hours_per_day=focus_hours_per_day)
+        return [
+            self._format_effort(lo, med, up, ctx, focus_hours_per_day)
+            for lo, med, up in zip(lowers, medians, uppers)
+        ]
 
-    def _predict_schedule_risk(self, item_data: dict, sprint_context: dict) -> dict:
-        try:
-            X     = build_schedule_risk_features(item_data, sprint_context)
-            model = self.models['schedule_risk']
-            proba = model.predict_proba(X)[0]
+    @staticmethod
+    def _format_effort(lower: float, median: float, upper: float,
+                       sprint_context: dict, focus_hours_per_day: float) -> dict:
+        # Ensure ordering
+        lower, upper = min(lower, median), max(upper, median)
 
-            print(f"[SCHED] classes_: {model.classes_}", file=sys.stderr)
-            print(f"[SCHED] proba: {proba}", file=sys.stderr)
-
-            classes = model.classes_
-
-            # Weighted class-midpoint scoring.
-            # P(High)+P(Critical) is almost always <0.1% → rounds to 0%.
-            # Instead, use each class's risk-band midpoint as its contribution
-            # weight so the score reflects the dominant class meaningfully:
-            #   Low dominant  ~99%  → score ≈ 5%
-            #   Med dominant  ~99%  → score ≈ 30%
-            #   High dominant ~99%  → score ≈ 65%
-            #   Crit dominant ~99%  → score ≈ 90%
-            spillover_prob_value = 0.0
-            for idx, class_label in enumerate(classes):
-                label_str  = SCHEDULE_LABEL_MAP.get(int(class_label), 'Low Risk')
-                midpoint   = SCHEDULE_CLASS_MIDPOINTS.get(int(class_label), 5.0)
-                spillover_prob_value += float(proba[idx]) * midpoint
-                print(f"[SCHED] class {class_label} ({label_str}): p={proba[idx]:.4f} × {midpoint} = {proba[idx]*midpoint:.3f}", file=sys.stderr)
-
-            spillover_prob = _cap(spillover_prob_value)   # already on 0-100 scale
-            print(f"[SCHED] Weighted spillover score: {spillover_prob:.1f}%", file=sys.stderr)
-
-            dominant_idx   = int(np.argmax(proba))
-            dominant_class = classes[dominant_idx]
-            dominant_label = SCHEDULE_LABEL_MAP.get(int(dominant_class), 'Low Risk')
-            print(f"[SCHED] Dominant class: {dominant_label}", file=sys.stderr)
-
-            # Sanity check: tiny ticket + plenty of capacity → cap at LOW band
-            story_points  = float(item_data.get('story_points', 5))
-            team_velocity = float(sprint_context.get('team_velocity_14d', 30))
-            remaining_sp  = float(sprint_context.get('remaining_committed', team_velocity))
-            free_capacity = max(0.0, team_velocity - remaining_sp)
-            capacity_pct  = (free_capacity / max(1.0, team_velocity)) * 100
-
-            if story_points <= 2 and capacity_pct > 50 and spillover_prob > 20:
-                print(
-                    f"[SCHED] SANITY OVERRIDE: SP={story_points}, free={capacity_pct:.0f}% → cap to LOW",
-                    file=sys.stderr,
-                )
-                spillover_prob = min(spillover_prob, 10.0)
-                dominant_label = 'Low Risk'
-
-            if spillover_prob > 50:
-                status, label = 'critical', 'High Risk'
-            elif spillover_prob > 30:
-                status, label = 'warning',  'Moderate Risk'
-            else:
-                status, label = 'safe',     'Low Risk'
+        days_remaining  = _days_remaining(sprint_context)
+        hours_remaining = days_remaining * focus_hours_per_day
 
-            return {
-                'probability':    spillover_prob,
-                'status':         status,
-                'status_label':   label,
-                'dominant_class': dominant_label,
-                'explanation':    f"'{dominant_label}'. {spillover_prob:.0f}% spillover probability.",
-            }
+        status, label, _ = _EFF_BANDS[bisect.bisect_left((hours_remaining * 0.8, hours_remaining), median)]
+
+        return {
+            'hours_lower':     round(lower, 1),
+            'hours_median':    round(median, 1),
+            'hours_upper':     round(upper, 1),
+            'hours_remaining': round(hours_remaining, 1),
+            'status':          status,
+            'status_label':    label,
+            'explanation':     f"Predicted {median:.1f}h vs {hours_remaining:.0f}h remaining.",
+        }
+
+    def _predict_schedule_risk(self, item_data: dict, sprint_context: dict, derived=None) -> dict:
+        try:
+            X     = build_schedule_risk_features(item_data, sprint_context, derived=derived)
+            model = self._sched_model()
+            proba = model.predict_proba(X)[0]
+            return self._format_schedule_risk(proba, model.classes_, item_data, sprint_context)
         except Exception as e:
-            print(f"\n[SCHEDULE RISK ERROR] {type(e).__name__}: {e}")
-            traceback.print_exc()
-            try:
-                if 'X' in locals():
-                    print(f"[DEBUG] Feature shape: {X.shape if hasattr(X, 'shape') else 'unknown'}")
-            except Exception:
-                pass
+            logger.exception("[SCHEDULE RISK ERROR] %s: %s", type(e).__name__, e)
             return self._fallback_schedule_risk(item_data, sprint_context)
 
+    def _predict_schedule_risk_batch(self, items, ctx, derived) -> list:
+        try:
+            model = self._sched_model()
+            X     = build_schedule_risk_features_batch(items, ctx, derived=derived)
+            probas = model.predict_proba(X)
+        except Exception as e:
+            logger.warning("[SCHEDULE BATCH] %s: %s — scoring per item", type(e).__name__, e)
+            return self._predict_per_item(
+                "Schedule risk", items, ctx, derived, self._predict_schedule_risk,
+                self._heuristic_schedule_risk)
+        return [
+            self._format_schedule_risk(proba, model.classes_, it, ctx)
+            for it, proba in zip(items, probas)
+        ]
+
+    @staticmethod
+    def _format_schedule_risk(proba, classes, item_data: dict, sprint_context: dict) -> dict:
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[SCHED] classes_: %s", classes)
+            logger.debug("[SCHED] proba: %s", proba)
+
+        # Weighted class-midpoint scoring.
+        # P(High)+P(Critical) is almost always <0.1% → rounds to 0%.
+        # Instead, use each class's risk-band midpoint as its contribution
+        # weight so the score reflects the dominant class meaningfully:
+        #   Low dominant  ~99%  → score ≈ 5%
+        #   Med dominant  ~99%  → score ≈ 30%
+        #   High dominant ~99%  → score ≈ 65%
+        #   Crit dominant ~99%  → score ≈ 90%
+        # One pass over plain Python floats gives both the weighted score and
+        # the dominant class; unknown class codes count as Low Risk (code 0)
+        spillover_prob_value = 0.0
+        dominant_code, dominant_p = 0, -1.0
+        for class_label, p in zip(classes.tolist(), proba.tolist()):
+            code = class_label if 0 <= class_label < 4 else 0
+            midpoint = SCHEDULE_CLASS_MIDPOINTS[code]
+            spillover_prob_value += p * midpoint
+            if p > dominant_p:
+                dominant_code, dominant_p = code, p
+            if debug:
+                logger.debug("[SCHED] class %s (%s): p=%.4f × %s = %.3f",
+                             class_label, SCHEDULE_LABELS[code], p, midpoint, p * midpoint)
+
+        spillover_prob = _cap(spillover_prob_value)   # already on 0-100 scale
+        dominant_label = SCHEDULE_LABELS[dominant_code]
+        if debug:
+            logger.debug("[SCHED] Weighted spillover score: %.1f%%", spillover_prob)
+            logger.debug("[SCHED] Dominant class: %s", dominant_label)
+
+        # Sanity check: tiny ticket + plenty of capacity → cap at LOW band
+        story_points  = float(item_data.get('story_points', 5))
+        team_velocity = float(sprint_context.get('team_velocity_14d', 30))
+        remaining_sp  = float(sprint_context.get('remaining_committed', team_velocity))
+        free_capacity = max(0.0, team_velocity - remaining_sp)
+        capacity_pct  = (free_capacity / max(1.0, team_velocity)) * 100
+
+        if story_points <= 2 and capacity_pct > 50 and spillover_prob > 20:
+            logger.debug("[SCHED] SANITY OVERRIDE: SP=%s, free=%.0f%% → cap to LOW",
+                         story_points, capacity_pct)
+            spillover_prob = min(spillover_prob, 10.0)
+            dominant_label = 'Low Risk'
+
+        status, label = _SCH_STATUS[bisect.bisect_left(_SCH_BINS, spillover_prob)]
+
+        return {
+            'probability':    spillover_prob,
+            'status':         status,
+            'status_label':   label,
+            'dominant_class': dominant_label,
+            'explanation':    f"'{dominant_label}'. {spillover_prob:.0f}% spillover probability.",
+        }
+
     # ── 3. Quality risk ───────────────────────────────────────────────────────
-    def _predict_quality_risk(self, item_data: dict, sprint_context: dict) -> dict:
+    def _predict_quality_risk(self, item_data: dict, sprint_context: dict, derived=None) -> dict:
         try:
-            X     = build_quality_features(item_data, sprint_context)
-            model = self.models.get('quality_risk')
+            X     = build_quality_features(item_data, sprint_context, derived=derived,
+                                           out=self._row_buffers()['quality'])
+            model = self._m_qual
             if model is None:
-                print("[QUALITY RISK] Model not loaded from model_loader")
+                logger.warning("[QUALITY RISK] Model not loaded from model_loader")
                 return self._fallback_quality_risk()
 
             # ── Debug: log array properties before inference ──────────────────
-            print(f"\n[QUALITY RISK] Input array shape: {X.shape}", file=__import__('sys').stderr)
-            print(f"[QUALITY RISK] Input array dtype: {X.dtype}", file=__import__('sys').stderr)
-            print(f"[QUALITY RISK] Input array values: {X}", file=__import__('sys').stderr)
-            print(f"[QUALITY RISK] Model type: {type(model)}", file=__import__('sys').stderr)
-            print(f"[QUALITY RISK] Calling predict_proba()...", file=__import__('sys').stderr)
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("[QUALITY RISK] Input array shape: %s, dtype: %s, values: %s",
+                             X.shape, X.dtype, X)
+                logger.debug("[QUALITY RISK] Model type: %s", type(model))
 
             proba      = model.predict_proba(X)[0]
             defect_pct = _cap(float(proba[1]) * 100)
 
-            print(f"[QUALITY RISK] Proba output shape: {proba.shape}", file=__import__('sys').stderr)
-            print(f"[QUALITY RISK] Proba values: {proba}", file=__import__('sys').stderr)
-            print(f"[QUALITY RISK] Defect %: {defect_pct}\n", file=__import__('sys').stderr)
-
-            if defect_pct > 60:
-                status, label = 'critical', 'High Bug Risk'
-            elif defect_pct > 30:
-                status, label = 'warning', 'Elevated Risk'
-            else:
-                status, label = 'safe', 'Standard Risk'
+            if debug:
+                logger.debug("[QUALITY RISK] Proba values: %s → defect %%: %s", proba, defect_pct)
 
-            return {
-                'probability':  defect_pct,
-                'status':       status,
-                'status_label': label,
-                'explanation':  f"{defect_pct:.0f}% defect likelihood.",
-            }
+            return self._format_quality_risk(defect_pct)
         except Exception as e:
-            print(f"\n[QUALITY RISK ERROR] {type(e).__name__}: {e}")
-            traceback.print_exc()
-            print(f"[DEBUG] Feature array shape: {X.shape if 'X' in locals() and hasattr(X, 'shape') else 'unknown'}")
-            print(f"[DEBUG] Feature dtype: {X.dtype if 'X' in locals() and hasattr(X, 'dtype') else 'unknown'}\n")
+            logger.exception("[QUALITY RISK ERROR] %s: %s", type(e).__name__, e)
             return self._fallback_quality_risk()
 
+    def _predict_quality_risk_batch(self, items, ctx, derived) -> list:
+        model = self._m_qual
+        try:
+            if model is None:
+                raise LookupError("quality_risk model not loaded")
+            X      = build_quality_features_batch(items, ctx, derived=derived)
+            probas = model.predict_proba(X)[:, 1].tolist()
+        except Exception as e:
+            logger.warning("[QUALITY BATCH] %s: %s — scoring per item", type(e).__name__, e)
+            return self._predict_per_item(
+                "Quality risk", items, ctx, derived, self._predict_quality_risk,
+                self._heuristic_quality_risk)
+        return [self._format_quality_risk(_cap(p * 100)) for p in probas]
+
+    @staticmethod
+    def _format_quality_risk(defect_pct: float) -> dict:
+        status, label, _ = _QUA_BANDS[bisect.bisect_left(_QUA_BINS, defect_pct)]
+
+        return {
+            'probability':  defect_pct,
+            'status':       status,
+            'status_label': label,
+            'explanation':  f"{defect_pct:.0f}% defect likelihood.",
+        }
+
     # ── 4. Productivity — hybrid XGBoost + MLP ensemble ─────────────────���─────
-    def _predict_productivity(self, item_data: dict, sprint_context: dict) -> dict:
+    def _predict_productivity(self, item_data: dict, sprint_context: dict, derived=None) -> dict:
         try:
-            X = build_productivity_features(item_data, sprint_context)
+            X = build_productivity_features(item_data, sprint_context, derived=derived,
+                                            out=self._row_buffers()['productivity'])
 
             preds = []
 
             # XGBoost component
-            if 'productivity_xgb' in self.models and XGBOOST_AVAILABLE:
-                dmat = xgb.DMatrix(X)
-                raw  = float(self.models['productivity_xgb'].predict(dmat)[0])
+            if self._m_prod_xgb is not None:
+                raw = float(self._m_prod_xgb.inplace_predict(X)[0])
                 preds.append(raw)
 
             # MLP component
-            if 'productivity_nn' in self.models and TORCH_AVAILABLE:
+            if self._m_prod_nn is not None:
                 with torch.no_grad():
                     tensor = torch.tensor(X, dtype=torch.float32)
-                    raw_nn = float(self.models['productivity_nn'](tensor)[0, 0])
+                    raw_nn = float(self._m_prod_nn(tensor)[0, 0])
                 preds.append(raw_nn)
 
             if not preds:
                 return self._fallback_productivity(sprint_context)
+            return self._format_productivity(preds, sprint_context)
+        except Exception as e:
+            logger.exception("[PRODUCTIVITY ERROR] %s: %s (XGBoost available: %s, MLP available: %s)",
+                             type(e).__name__, e, XGBOOST_AVAILABLE, TORCH_AVAILABLE)
+            return self._fallback_productivity(sprint_context)
 
-            # ── Log-space decoding ────────────────────────────────────────────
-            # Both models were trained with log-space targets (stated in the
-            # project description: "Log-Space Prediction to stabilise errors on
-            # power-law productivity data"). Raw output = log(drop_percent), so:
-            #   raw=1.0 → exp(1.0) = 2.7% drop    (light ticket)
-            #   raw=2.5 → exp(2.5) = 12.2% drop   (medium ticket)
-            #   raw=3.5 → exp(3.5) = 33.1% drop   (heavy mid-sprint addition)
-            raw_avg        = float(np.mean(preds))
-            
-            # ── SATURATION GUARD ──────────────────────────────────────────────
-            # If raw_avg > 4.5, the percentage is no longer meaningful (would be
-            # >90% drop). Instead of capping at 99%, return CRITICAL_VOLATILITY.
-            SATURATION_THRESHOLD = 4.5
-            days_remaining = max(1, sprint_context.get('days_remaining', 14))
-            
-            if raw_avg > SATURATION_THRESHOLD:
-                return {
-                    'velocity_change': None,  # N/A for volatile prediction
-                    'drop_pct':        None,
-                    'days_lost':       None,
-                    'days_remaining':  days_remaining,
-                    'saturation_status': 'CRITICAL_VOLATILITY',
-                    'status':          'critical',
-                    'status_label':    'VOLATILE',
-                    'explanation':     (
-                        "Productivity impact is too severe to quantify. The model predicts "
-                        "extraordinary context-switching costs that exceed normal estimation bounds. "
-                        "This task should only be added with explicit risk acceptance."
-                    ),
-                }
-            
-            drop_pct       = min(99.0, float(np.exp(raw_avg)))  # always positive %
-            velocity_change= round(-drop_pct, 1)                # negative = drag
-            days_lost      = round((drop_pct / 100.0) * days_remaining, 1)
-
-            if drop_pct > 30:
-                status, label = 'critical', 'High Drag'
-            elif drop_pct > 10:
-                status, label = 'warning',  'Negative'
-            else:
-                status, label = 'safe',     'Minimal Impact'
+    def _predict_productivity_batch(self, items, ctx, derived) -> list:
+        try:
+            X = build_productivity_features_batch(items, ctx, derived=derived)
 
+            columns = []
+            if self._m_prod_xgb is not None:
+                columns.append(self._m_prod_xgb.inplace_predict(X).tolist())
+            if self._m_prod_nn is not None:
+                with torch.no_grad():
+                    columns.append(self._m_prod_nn(torch.from_numpy(X))[:, 0].tolist())
+        except Exception as e:
+            logger.warning("[PRODUCTIVITY BATCH] %s: %s — scoring per item", type(e).__name__, e)
+            return self._predict_per_item(
+                "Productivity", items, ctx, derived, self._predict_productivity,
+                self._heuristic_productivity)
+        if not columns:
+            return [self._fallback_productivity(ctx) for _ in items]
+        return [self._format_productivity(list(preds), ctx) for preds in zip(*columns)]
+
+    @staticmethod
+    def _format_productivity(preds: list, sprint_context: dict) -> dict:
+        # ── Log-space decoding ────────────────────────────────────────────
+        # Both models were trained with log-space targets (stated in the
+        # project description: "Log-Space Prediction to stabilise errors on
+        # power-law productivity data"). Raw output = log(drop_percent), so:
+        #   raw=1.0 → exp(1.0) = 2.7% drop    (light ticket)
+        #   raw=2.5 → exp(2.5) = 12.2% drop   (medium ticket)
+        #   raw=3.5 → exp(3.5) = 33.1% drop   (heavy mid-sprint addition)
+        raw_avg        = float(np.mean(preds))
+        
+        # ── SATURATION GUARD ──────────────────────────────────────────────
+        # If raw_avg > 4.5, the percentage is no longer meaningful (would be
+        # >90% drop). Instead of capping at 99%, return CRITICAL_VOLATILITY.
+        SATURATION_THRESHOLD = 4.5
+        days_remaining = _days_remaining(sprint_context)
+        
+        if raw_avg > SATURATION_THRESHOLD:
             return {
-                'velocity_change': velocity_change,   # e.g. -15.0
-                'drop_pct':        round(drop_pct, 1),# e.g.  15.0
-                'days_lost':       days_lost,
+                'velocity_change': None,  # N/A for volatile prediction
+                'drop_pct':        None,
+                'days_lost':       None,
                 'days_remaining':  days_remaining,
-                'saturation_status': 'NORMAL',
-                'status':          status,
-                'status_label':    label,
+                'saturation_status': 'CRITICAL_VOLATILITY',
+                'status':          'critical',
+                'status_label':    'VOLATILE',
                 'explanation':     (
-                    f"Context switching to this task will slow down the remaining "
-                    f"backlog items by approximately {drop_pct:.0f}%."
+                    "Productivity impact is too severe to quantify. The model predicts "
+                    "extraordinary context-switching costs that exceed normal estimation bounds. "
+                    "This task should only be added with explicit risk acceptance."
                 ),
             }
-        except Exception as e:
-            print(f"\n[PRODUCTIVITY ERROR] {type(e).__name__}: {e}")
-            traceback.print_exc()
-            print(f"[DEBUG] Feature array shape: {X.shape if 'X' in locals() and hasattr(X, 'shape') else 'unknown'}")
-            print(f"[DEBUG] Feature dtype: {X.dtype if 'X' in locals() and hasattr(X, 'dtype') else 'unknown'}")
-            if 'preds' in locals():
-                print(f"[DEBUG] Predictions collected: {preds}")
-            print(f"[DEBUG] XGBoost available: {XGBOOST_AVAILABLE}, MLP available: {TORCH_AVAILABLE}\n")
-            return self._fallback_productivity(sprint_context)
+        
+        drop_pct       = min(99.0, float(np.exp(raw_avg)))  # always positive %
+        velocity_change= round(-drop_pct, 1)                # negative = drag
+        days_lost      = round((drop_pct / 100.0) * days_remaining, 1)
+
+        status, label, _ = _PRD_BANDS[bisect.bisect_left(_PRD_BINS, drop_pct)]
+
+        return {
+            'velocity_change': velocity_change,   # e.g. -15.0
+            'drop_pct':        round(drop_pct, 1),# e.g.  15.0
+            'days_lost':       days_lost,
+            'days_remaining':  days_remaining,
+            'saturation_status': 'NORMAL',
+            'status':          status,
+            'status_label':    label,
+            'explanation':     (
+                f"Context switching to this task will slow down the remaining "
+                f"backlog items by approximately {drop_pct:.0f}%."
+            ),
+        }
 
     # ── summary scorer ────────────────────────────────────────────────────────
     def _generate_summary(self, effort, schedule, quality, productivity, risk_appetite: str = "Standard") -> dict:
@@ -511,36 +882,47 @@ class ImpactPredictor:
         Generate risk summary with thresholds adjusted by risk appetite.
         Strict: More conservative (DEFER score=5), Standard: Balanced (score=7), Lenient: Permissive (score=9)
         """
-        # Risk appetite thresholds for recommendation scores
-        thresholds = {
-            "Strict": {"defer": 5, "swap": 3, "split": 1},
-            "Standard": {"defer": 7, "swap": 4, "split": 2},
-            "Lenient": {"defer": 9, "swap": 6, "split": 3},
-        }
-        
-        thresh = thresholds.get(risk_appetite, thresholds["Standard"])
-        defer_threshold = thresh["defer"]
-        swap_threshold = thresh["swap"]
-        split_threshold = thresh["split"]
-        
-        score = 0
-        if effort['status']     == 'critical': score += 3
-        elif effort['status']   == 'warning':  score += 2
-        if schedule.get('probability', 0) > 50: score += 3
-        elif schedule.get('probability', 0) > 30: score += 2
-        if quality.get('probability', 0) > 60:  score += 2
-        elif quality.get('probability', 0) > 30: score += 1
-        if productivity.get('drop_pct', abs(productivity.get('velocity_change', 0))) > 30: score += 2
-        elif productivity.get('drop_pct', abs(productivity.get('velocity_change', 0))) > 10: score += 1
-
-        if score >= defer_threshold:
-            return {'risk_score': score, 'overall_risk': 'critical', 'recommendation': 'DEFER', 'risk_appetite': risk_appetite}
-        elif score >= swap_threshold:
-            return {'risk_score': score, 'overall_risk': 'high',     'recommendation': 'SWAP', 'risk_appetite': risk_appetite}
-        elif score >= split_threshold:
-            return {'risk_score': score, 'overall_risk': 'medium',   'recommendation': 'SPLIT', 'risk_appetite': risk_appetite}
-        else:
-            return {'risk_score': score, 'overall_risk': 'low',      'recommendation': 'ADD', 'risk_appetite': risk_appetite}
+        # Per-metric points reuse the display band cut points (_SCH_BINS etc.)
+        drop_pct = productivity.get('drop_pct', abs(productivity.get('velocity_change', 0)))
+        score = (
+            _EFFORT_STATUS_POINTS.get(effort['status'], 0)
+            + _SCH_POINTS[bisect.bisect_left(_SCH_BINS, schedule.get('probability', 0))]
+            + _QUA_POINTS[bisect.bisect_left(_QUA_BINS, quality.get('probability', 0))]
+            + _PRD_POINTS[bisect.bisect_left(_PRD_BINS, drop_pct)]
+        )
+
+        cuts = _APPETITE_CUTS.get(risk_appetite, _APPETITE_CUTS["Standard"])
+        overall_risk, recommendation = _SUMMARY_TIERS[bisect.bisect_right(cuts, score)]
+        return {'risk_score': score, 'overall_risk': overall_risk,
+                'recommendation': recommendation, 'risk_appetite': risk_appetite}
+
+    @staticmethod
+    def _generate_summary_batch(efforts, schedules, qualities, productivities,
+                                risk_appetite: str = "Standard") -> list:
+        """
+        _generate_summary for a whole batch: each metric is banded with one
+        np.searchsorted over its cut points and the point totals are tiered
+        with a second.  Raises on a malformed prediction dict; callers fall
+        back to the per-item form.
+        """
+        n = len(efforts)
+        sched = np.fromiter((s.get('probability', 0) for s in schedules), dtype=np.float64, count=n)
+        qual  = np.fromiter((q.get('probability', 0) for q in qualities), dtype=np.float64, count=n)
+        drop  = np.fromiter((p.get('drop_pct', abs(p.get('velocity_change', 0))) for p in productivities),
+                            dtype=np.float64, count=n)
+        scores = (
+            np.fromiter((_EFFORT_STATUS_POINTS.get(e['status'], 0) for e in efforts), dtype=np.int64, count=n)
+            + np.take(_SCH_POINTS, np.searchsorted(_SCH_BINS, sched))
+            + np.take(_QUA_POINTS, np.searchsorted(_QUA_BINS, qual))
+            + np.take(_PRD_POINTS, np.searchsorted(_PRD_BINS, drop))
+        )
+        cuts  = _APPETITE_CUTS.get(risk_appetite, _APPETITE_CUTS["Standard"])
+        tiers = np.searchsorted(cuts, scores, side='right').tolist()
+        return [
+            {'risk_score': score, 'overall_risk': _SUMMARY_TIERS[t][0],
+             'recommendation': _SUMMARY_TIERS[t][1], 'risk_appetite': risk_appetite}
+            for score, t in zip(scores.tolist(), tiers)
+        ]
 
     # ── fallbacks (legacy) ────────────────────────────────────────────────────
     def _fallback_effort(self, item_data, sprint_context,
@@ -554,24 +936,27 @@ class ImpactPredictor:
             'status': status,
             'status_label': 'Sprint Overload' if status == 'critical' else 'Estimated',
             'explanation': 'Fallback: 5h per story point',
+            'error_flag': _FALLBACK_FLAG,
         }
 
     def _fallback_schedule_risk(self, item_data, sprint_context):
         sp   = item_data.get('story_points', 5)
-        days = max(1, sprint_context.get('days_remaining', 14))
+        days = _days_remaining(sprint_context)
         risk = _cap((sp / days) * 50)
         status = 'critical' if risk > 50 else ('warning' if risk > 30 else 'safe')
         label  = 'High Risk'     if status == 'critical' else \
                  'Moderate Risk' if status == 'warning'  else 'Low Risk'
         return {'probability': risk, 'status': status, 'status_label': label,
-                'dominant_class': 'N/A', 'explanation': 'Fallback estimate'}
+                'dominant_class': 'N/A', 'explanation': 'Fallback estimate',
+                'error_flag': _FALLBACK_FLAG}
 
     def _fallback_quality_risk(self):
         return {'probability': 40.0, 'status': 'warning',
-                'status_label': 'Elevated Risk', 'explanation': 'Fallback quality estimate'}
+                'status_label': 'Elevated Risk', 'explanation': 'Fallback quality estimate',
+                'error_flag': _FALLBACK_FLAG}
 
     def _fallback_productivity(self, sprint_context):
-        days = max(1, sprint_context.get('days_remaining', 14))
+        days = _days_remaining(sprint_context)
         return {
             'velocity_change': -10.0,
             'drop_pct':        10.0,
@@ -580,6 +965,7 @@ class ImpactPredictor:
             'status':          'warning',
             'status_label':    'Negative',
             'explanation':     'Context switching to this task will slow down the remaining backlog items.',
+            'error_flag':      _FALLBACK_FLAG,
         }
     
     # ── heuristic fallbacks (when ML models fail) ─────────────────────────────
@@ -587,7 +973,7 @@ class ImpactPredictor:
         """Heuristic effort estimation when ML fails."""
         sp = item_data.get('story_points', 5)
         hours = sp * focus_hours_per_day
-        days_remaining = max(1, ctx.get('days_remaining', 14))
+        days_remaining = _days_remaining(ctx)
         hours_remaining = days_remaining * focus_hours_per_day
         
         if hours > hours_remaining:
@@ -612,7 +998,7 @@ class ImpactPredictor:
     def _heuristic_schedule_risk(self, item_data, ctx):
         """Heuristic schedule risk when ML fails."""
         sp = item_data.get('story_points', 5)
-        days = max(1, ctx.get('days_remaining', 14))
+        days = _days_remaining(ctx)
         sp_per_day = sp / days
         
         # Simple heuristic: if more than 2 SP/day, it's risky
@@ -664,7 +1050,7 @@ class ImpactPredictor:
     def _heuristic_productivity(self, item_data, ctx):
         """Heuristic productivity impact when ML fails."""
         sp = item_data.get('story_points', 5)
-        days = max(1, ctx.get('days_remaining', 14))
+        days = _days_remaining(ctx)
         
         # Larger items mid-sprint = more context switching impact
         sprint_progress = ctx.get('sprint_progress', 0.5)
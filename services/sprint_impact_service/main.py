@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from routes import space_routes, sprint_routes, backlog_routes, analytics_routes, ai_routes, impact_routes
 from database import connect_db, close_db
 from model_loader import model_loader
+from impact_predictor import impact_predictor
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -14,7 +15,9 @@ async def lifespan(app: FastAPI):
     print("="*50)
     try:
         models_loaded = model_loader.load_all_models()
+        impact_predictor.refresh_models()
         if models_loaded:
+            impact_predictor.warm_up()
             print("\n✓ ML Models initialization complete\n")
         else:
             print("\n⚠ Warning: Some ML models failed to load")
@@ -64,5 +67,13 @@ async def health():
     }
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # One process per core (capped at 8): boosters are pinned to nthread=1,
+    # so requests scale across worker processes rather than OpenMP threads.
+    # Each worker runs the lifespan and loads its own copy of the models.
+    # Exported so the workers size themselves from it: Mongo pools are split
+    # between them and the per-process prediction pool is off when > 1.
+    workers = int(os.environ.get("WEB_CONCURRENCY", min(8, os.cpu_count() or 1)))
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=workers)
\ No newline at end of file
@@ -9,7 +9,10 @@ ml_models/
   effort_model_upper.json          XGBoost Booster   105 features
   schedule_risk_model.pkl          XGBClassifier     9 features  (multi:softprob, 4 classes)
   tabnet_quality_model.zip         TabNetClassifier  6 features  (binary)
+  tabnet_quality_model.cache.pt    TabNet params + weights in one torch.save, written on first load
   model_productivity_xgb.json      XGBoost Booster   9 features  (reg:squarederror)
+  *.ubj                            binary copies of the Booster JSON files, written on first load
+  *.so                             Treelite-compiled Boosters (only with IMPACT_TREELITE=1)
   model_productivity_nn.pth        PyTorch MLP       9→64→32→1
   effort_artifacts.pkl             {tfidf, le_type}
   risk_artifacts.pkl               {imputer, le_type, le_prio, label_map, feature_names}
@@ -20,9 +23,11 @@ ml_models/
 """
 
 import io
+import os
 import json
 import pickle
 import shutil
+import tempfile
 import warnings
 import zipfile
 import traceback
@@ -57,6 +62,17 @@ try:
 except ImportError:
     TABNET_AVAILABLE = False
 
+try:
+    import treelite
+    import tl2cgen
+    TREELITE_AVAILABLE = True
+except ImportError:
+    TREELITE_AVAILABLE = False
+
+# Opt-in compiled tree inference for the Booster models (needs a C toolchain
+# on first start to build the .so files); off by default
+USE_TREELITE = os.environ.get('IMPACT_TREELITE', '').lower() in ('1', 'true', 'yes')
+
 
 def _joblib_load(path):
     if JOBLIB_AVAILABLE:
@@ -67,6 +83,216 @@ def _joblib_load(path):
         return pickle.load(f)
 
 
+def _pin_single_thread(model):
+    """
+    Requests score one row (or a small backlog batch) at a time, where
+    xgboost's OpenMP pool costs more to wake than the trees take to walk.
+    Pinned once at load — calling set_param per predict would reconfigure
+    the booster on every request.  Single-threaded boosters are also safe
+    under forking server workers, where a pre-fork OpenMP pool can hang.
+
+    Backlog-sized batches (predict_all_impacts_batch) stay single-threaded
+    too; a caller scoring very large batches can raise nthread around that
+    call, never inside the per-item path.
+    """
+    try:
+        if hasattr(model, 'get_booster'):    # sklearn wrapper (XGBClassifier)
+            model.set_params(n_jobs=1)
+            model.get_booster().set_param({'nthread': 1})
+        else:
+            model.set_param({'nthread': 1})
+    except Exception as e:
+        print(f"  [xgb] could not pin nthread=1: {e}", file=sys.stderr)
+    return model
+
+
+def _atomic_write(path: Path, write) -> None:
+    """
+    Produce ``path`` via ``write(tmp_path)`` on a temp file in the same
+    directory, then os.replace it into place.  Several server workers may
+    build the same cache file on first start; readers only ever see a
+    missing or complete file, never a torn one.  The temp name keeps the
+    target suffix, since the writers pick their format from it.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.stem}-', suffix=path.suffix)
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _load_booster(json_path: Path):
+    """
+    Load an XGBoost Booster, preferring a binary UBJSON copy next to the
+    shipped JSON model.  UBJ parses much faster than JSON text, so the first
+    start converts each model once and later starts read the .ubj directly.
+    The cached copy is ignored if the JSON is newer (model retrained).
+    """
+    ubj_path = json_path.with_suffix('.ubj')
+    if ubj_path.exists() and (
+        not json_path.exists() or ubj_path.stat().st_mtime >= json_path.stat().st_mtime
+    ):
+        try:
+            m = xgb.Booster()
+            m.load_model(str(ubj_path))
+            return _pin_single_thread(m)
+        except Exception as e:
+            print(f"  [xgb] stale/corrupt {ubj_path.name}, reloading JSON: {e}", file=sys.stderr)
+
+    m = xgb.Booster()
+    m.load_model(str(json_path))
+    try:
+        _atomic_write(ubj_path, m.save_model)
+    except Exception as e:   # read-only model dir: keep serving from JSON
+        print(f"  [xgb] could not cache {ubj_path.name}: {e}", file=sys.stderr)
+    return _pin_single_thread(m)
+
+
+class _CompiledBooster:
+    """
+    Treelite-compiled stand-in for an xgboost Booster.  Serves the one call
+    the predictor makes (inplace_predict) from the compiled library and
+    delegates everything else to the source Booster.
+    """
+
+    def __init__(self, predictor, booster):
+        self._predictor = predictor
+        self.booster    = booster
+
+    def inplace_predict(self, X):
+        return self._predictor.predict(tl2cgen.DMatrix(X)).reshape(-1)
+
+    def __getattr__(self, name):
+        return getattr(self.booster, name)
+
+
+def _maybe_compile(booster, json_path: Path):
+    """
+    With IMPACT_TREELITE=1, compile the Booster to a shared library next to
+    its JSON (rebuilt when the JSON is newer) and serve predictions from it
+    once it matches the Booster on a probe batch.  Any failure — missing
+    toolchain, unsupported objective, differing output — keeps xgboost.
+    """
+    if not (USE_TREELITE and TREELITE_AVAILABLE):
+        return booster
+    lib_path = json_path.with_suffix('.so')
+    try:
+        if not lib_path.exists() or lib_path.stat().st_mtime < json_path.stat().st_mtime:
+            tl_model = treelite.frontend.from_xgboost(booster)
+            # Atomic: dlopen on a library another worker is still writing can crash
+            _atomic_write(lib_path, lambda tmp: tl2cgen.export_lib(
+                tl_model, toolchain='gcc', libpath=tmp,
+                params={'parallel_comp': os.cpu_count() or 1}))
+        compiled = _CompiledBooster(tl2cgen.Predictor(str(lib_path), nthread=1), booster)
+        probe = np.random.default_rng(0).random((16, booster.num_features()), dtype=np.float32)
+        if not np.allclose(compiled.inplace_predict(probe), booster.inplace_predict(probe).reshape(-1),
+                           rtol=1e-4, atol=1e-4):
+            raise ValueError("compiled output differs from xgboost")
+        return compiled
+    except Exception as e:
+        print(f"  [treelite] {json_path.stem}: {e} — using xgboost", file=sys.stderr)
+        return booster
+
+
+class _TracedTabNet:
+    """
+    TorchScript stand-in for a TabNetClassifier.  predict_proba runs the
+    traced network directly on the float32 rows, skipping pytorch-tabnet's
+    per-call DataLoader and batching loop.  The entmax attention masks still
+    call back into their Python autograd Function on every forward.
+    Everything else is delegated to the source classifier.
+    """
+
+    def __init__(self, module, clf):
+        self._module = module
+        self.clf     = clf
+
+    def predict_proba(self, X):
+        with torch.inference_mode():
+            output, _ = self._module(torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32)))
+            return torch.softmax(output, dim=1).numpy()
+
+    def __getattr__(self, name):
+        return getattr(self.clf, name)
+
+
+def _tabnet_probe(n_features: int) -> np.ndarray:
+    return np.linspace(0.0, 1.0, 2 * n_features, dtype=np.float32).reshape(2, n_features)
+
+
+def _tabnet_cache_key(zip_path: Path, params_path: Path) -> dict:
+    """
+    Identity of everything the cached TabNet weights were read from: the
+    model zip, the fallback model_params.json and the torch version.
+    """
+    key = {'torch': torch.__version__}
+    for name, path in (('zip', zip_path), ('params', params_path)):
+        if path.exists():
+            st = path.stat()
+            key[name] = [st.st_mtime_ns, st.st_size]
+    return key
+
+
+def _load_cached_tabnet(cache_path: Path, key: dict):
+    """
+    ``{init_params, class_attrs, state_dict}`` from the cached .pt, or None
+    when it is missing, unreadable or was written from different inputs.
+    """
+    if not cache_path.exists():
+        return None
+    try:
+        blob = torch.load(str(cache_path), map_location='cpu', weights_only=True)
+    except Exception as e:
+        print(f"  [TabNet] {cache_path.name} unreadable ({e}) — rebuilding from zip", file=sys.stderr)
+        return None
+    return blob if isinstance(blob, dict) and blob.get('key') == key else None
+
+
+def _read_tabnet_zip(zip_path: Path, params_path: Path) -> dict:
+    """Init params, class attributes and network weights from the shipped zip."""
+    with zipfile.ZipFile(zip_path) as zf:
+        names = zf.namelist()
+        saved = json.loads(zf.read('model_params.json')) if 'model_params.json' in names else None
+        net_bytes = zf.read('network.pt')
+    if saved is None and params_path.exists():
+        saved = json.loads(params_path.read_text())
+    if saved is None:
+        raise FileNotFoundError("model_params.json not found")
+    return {
+        'init_params': saved.get('init_params', {}),
+        'class_attrs': saved.get('class_attrs', {}),
+        'state_dict':  torch.load(io.BytesIO(net_bytes), map_location='cpu', weights_only=True),
+    }
+
+
+def _maybe_trace_tabnet(clf):
+    """
+    Trace the eval-mode TabNet network to TorchScript and check it against
+    the eager classifier on a probe batch.  Any failure or mismatch keeps
+    the eager TabNetClassifier.  The trace lives in memory only: the
+    entmax mask calls back into a Python autograd Function, which
+    torch.jit.save cannot export.
+    """
+    try:
+        probe = _tabnet_probe(clf.network.input_dim)
+        with torch.no_grad(), warnings.catch_warnings():
+            warnings.simplefilter('ignore')   # TracerWarnings for the batch-size ceil in GBN
+            module = torch.jit.freeze(torch.jit.trace(clf.network, torch.from_numpy(probe)))
+        traced = _TracedTabNet(module, clf)
+        if not np.allclose(traced.predict_proba(probe), clf.predict_proba(probe), atol=1e-5):
+            raise ValueError("traced output differs from eager TabNet")
+        return traced
+    except Exception as e:
+        print(f"  [TabNet] TorchScript trace unavailable: {e} — using eager model", file=sys.stderr)
+        return clf
+
+
 class ModelLoader:
     def __init__(self, models_dir='ml_models'):
         self.models_dir = Path(models_dir)
@@ -103,8 +329,7 @@ class ModelLoader:
         for variant in ['lower', 'median', 'upper']:
             path = self.models_dir / f'effort_model_{variant}.json'
             try:
-                m = xgb.Booster()
-                m.load_model(str(path))
+                m = _maybe_compile(_load_booster(path), path)
                 self.models[f'effort_{variant}'] = m
                 loaded += 1
                 print(f"✓ effort_{variant}")
@@ -115,7 +340,7 @@ class ModelLoader:
     def _load_schedule_risk(self) -> int:
         path = self.models_dir / 'schedule_risk_model.pkl'
         try:
-            self.models['schedule_risk'] = _joblib_load(path)
+            self.models['schedule_risk'] = _pin_single_thread(_joblib_load(path))
             print("✓ schedule_risk")
             return 1
         except Exception as e:
@@ -132,41 +357,32 @@ class ModelLoader:
 
         zip_path    = self.models_dir / 'tabnet_quality_model.zip'
         params_path = self.models_dir / 'model_params.json'
+        cache_path  = zip_path.with_suffix('.cache.pt')
 
         if not zip_path.exists():
             print("✗ quality_risk: tabnet_quality_model.zip not found")
             return 0
 
         try:
-            saved = None
-            with zipfile.ZipFile(zip_path) as zf:
-                if 'model_params.json' in zf.namelist():
-                    saved = json.loads(zf.read('model_params.json'))
-            if saved is None and params_path.exists():
-                saved = json.loads(params_path.read_text())
+            # One torch.load of a cache keyed on the zip, params and torch
+            # version, instead of two zip reads plus a JSON parse per start
+            cache_key = _tabnet_cache_key(zip_path, params_path)
+            saved = _load_cached_tabnet(cache_path, cache_key)
             if saved is None:
-                raise FileNotFoundError("model_params.json not found")
-
-            init_params = saved.get('init_params', {})
-            class_attrs = saved.get('class_attrs', {})
-
-            clf = TabNetClassifier(**init_params)
-            for k, v in class_attrs.items():
+                saved = _read_tabnet_zip(zip_path, params_path)
+                try:
+                    _atomic_write(cache_path, lambda tmp: torch.save({**saved, 'key': cache_key}, tmp))
+                except Exception as e:   # read-only models dir etc. — load from zip next time too
+                    print(f"  [TabNet] could not write {cache_path.name}: {e}", file=sys.stderr)
+
+            clf = TabNetClassifier(**saved['init_params'])
+            for k, v in saved['class_attrs'].items():
                 setattr(clf, k, v)
             clf._set_network()
-
-            with zipfile.ZipFile(zip_path) as zf:
-                net_bytes = zf.read('network.pt')
-
-            state_dict = torch.load(
-                io.BytesIO(net_bytes),
-                map_location='cpu',
-                weights_only=True,
-            )
-            clf.network.load_state_dict(state_dict)
+            clf.network.load_state_dict(saved['state_dict'])
             clf.network.eval()
 
-            self.models['quality_risk'] = clf
+            self.models['quality_risk'] = _maybe_trace_tabnet(clf)
             print("✓ quality_risk")
             print(f"  [TabNet] Network structure: {clf.network}", file=sys.stderr)
             return 1
@@ -182,8 +398,7 @@ class ModelLoader:
         if XGBOOST_AVAILABLE:
             path = self.models_dir / 'model_productivity_xgb.json'
             try:
-                m = xgb.Booster()
-                m.load_model(str(path))
+                m = _maybe_compile(_load_booster(path), path)
                 self.models['productivity_xgb'] = m
                 loaded += 1
                 print("✓ productivity_xgb")
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 from database import (
     get_sprint_by_id,
@@ -113,14 +114,15 @@ async def get_team_pace(space_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/sprints/{sprint_id}/burndown")
+@router.get("/sprints/{sprint_id}/burndown", response_class=ORJSONResponse)
 async def get_sprint_burndown(sprint_id: str):
     """Get burndown chart data for a sprint (logic-based, NO DL)"""
     try:
         data = await calculate_burndown_data(sprint_id)
         if not data:
             raise HTTPException(status_code=404, detail="Sprint not found")
-        return data
+        # ORJSONResponse serialises the NumPy series without a .tolist() pass
+        return ORJSONResponse(data)
     except HTTPException:
         raise
     except Exception as e:
@@ -128,14 +130,14 @@ async def get_sprint_burndown(sprint_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/sprints/{sprint_id}/burnup")
+@router.get("/sprints/{sprint_id}/burnup", response_class=ORJSONResponse)
 async def get_sprint_burnup(sprint_id: str):
     """Get burnup chart data for a sprint (logic-based, NO DL)"""
     try:
         data = await calculate_burnup_data(sprint_id)
         if not data:
             raise HTTPException(status_code=404, detail="Sprint not found")
-        return data
+        return ORJSONResponse(data)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
@@ -114,6 +116,19 @@ class AnalyzeRequest(BaseModel):
     type:         str = Field(default="Task")
 
 
+class BatchAnalyzeItem(BaseModel):
+    title:        str = Field(..., min_length=1, max_length=300)
+    description:  str = Field(default="")
+    story_points: int = Field(default=5, ge=1, le=100)
+    priority:     str = Field(default="Medium")
+    type:         str = Field(default="Task")
+
+
+class BatchAnalyzeRequest(BaseModel):
+    sprint_id: str
+    items:     List[BatchAnalyzeItem] = Field(..., min_length=1, max_length=200)
+
+
 class FeedbackRequest(BaseModel):
     accepted:     Optional[bool] = None
     taken_action: Optional[str]  = None
@@ -309,21 +324,8 @@ async def get_analysis_history(
     return {"history": logs, "total": len(logs)}
 
 
-@router.post("/analyze")
-async def analyze_impact(body: AnalyzeRequest):
-    # 0. Input validation
-    is_valid, error_message = validate_requirement(body.title, body.description)
-    if not is_valid:
-        raise HTTPException(status_code=400, detail=error_message)
-
-    # 1. Fetch sprint and items
-    sprint = await get_sprint_by_id(body.sprint_id)
-    if not sprint:
-        raise HTTPException(status_code=404, detail=f"Sprint '{body.sprint_id}' not found.")
-
-    existing_items = await get_backlog_items_by_sprint(body.sprint_id)
-
-    # 2. Space settings + historical velocity
+async def _resolve_space_settings(sprint: dict) -> tuple:
+    """(space_id, focus_hours_per_day, risk_appetite, historical_velocity) for a sprint."""
     focus_hours_per_day  = 6.0
     risk_appetite        = "Standard"
     space_id             = sprint.get("space_id", "")
@@ -345,6 +347,27 @@ async def analyze_impact(body: AnalyzeRequest):
         # FIX: fetch real historical velocity separately so it's always available
         historical_velocity = await get_historical_velocity(space_id)
 
+    return space_id, focus_hours_per_day, risk_appetite, historical_velocity
+
+
+@router.post("/analyze", response_class=ORJSONResponse)
+async def analyze_impact(body: AnalyzeRequest):
+    # 0. Input validation
+    is_valid, error_message = validate_requirement(body.title, body.description)
+    if not is_valid:
+        raise HTTPException(status_code=400, detail=error_message)
+
+    # 1. Fetch sprint and items
+    sprint = await get_sprint_by_id(body.sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail=f"Sprint '{body.sprint_id}' not found.")
+
+    existing_items = await get_backlog_items_by_sprint(body.sprint_id)
+
+    # 2. Space settings + historical velocity
+    space_id, focus_hours_per_day, risk_appetite, historical_velocity = \
+        await _resolve_space_settings(sprint)
+
     # 3. Build sprint context with correct velocity
     sprint_context = _build_sprint_context(sprint, existing_items, historical_velocity)
     free_capacity  = _compute_free_capacity(sprint_context)
@@ -359,9 +382,11 @@ async def analyze_impact(body: AnalyzeRequest):
         "sprint_id":    body.sprint_id,
     }
 
-    # 4. ML predictions — use corrected sprint_context
+    # 4. ML predictions — use corrected sprint_context.  Scoring is CPU-bound,
+    #    so it runs on the threadpool to keep the event loop serving requests
     try:
-        ml_result = impact_predictor.predict_all_impacts(
+        ml_result = await run_in_threadpool(
+            impact_predictor.predict_all_impacts,
             item_data, sprint_context, existing_items,
             focus_hours_per_day=focus_hours_per_day,
             risk_appetite=risk_appetite,
@@ -482,7 +507,9 @@ async def analyze_impact(body: AnalyzeRequest):
     except Exception as e:
         print(f"Log write failed: {e}")
 
-    return {
+    # Serialised straight to bytes by orjson: skips FastAPI's jsonable_encoder
+    # walk over the nested ML dicts (NumPy scalars are handled natively)
+    return ORJSONResponse({
         "log_id":      log_id,
         "sprint_id":   body.sprint_id,
         "space_id":    space_id,
@@ -510,7 +537,113 @@ async def analyze_impact(body: AnalyzeRequest):
             "focus_hours_per_day":  focus_hours_per_day,
             "assignee_count":       sprint_context["assignee_count"],
         },
-    }
+    })
+
+
+@router.post("/analyze-batch", response_class=ORJSONResponse)
+async def analyze_impact_batch(body: BatchAnalyzeRequest):
+    """
+    Score many candidate backlog items against one sprint in a single pass.
+    Each model runs once over the stacked feature rows instead of once per
+    item.  Read-only: no recommendation logs are written, so the frontend can
+    rank a backlog before the user commits to analysing any one item.
+    """
+    for item in body.items:
+        is_valid, error_message = validate_requirement(item.title, item.description)
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=f"{item.title!r}: {error_message}")
+
+    sprint = await get_sprint_by_id(body.sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail=f"Sprint '{body.sprint_id}' not found.")
+
+    existing_items = await get_backlog_items_by_sprint(body.sprint_id)
+    space_id, focus_hours_per_day, risk_appetite, historical_velocity = \
+        await _resolve_space_settings(sprint)
+
+    sprint_context = _build_sprint_context(sprint, existing_items, historical_velocity)
+    free_capacity  = _compute_free_capacity(sprint_context)
+
+    items = [
+        {
+            "title":        item.title,
+            "description":  item.description,
+            "type":         item.type,
+            "priority":     item.priority,
+            "story_points": item.story_points,
+            "status":       "To Do",
+            "sprint_id":    body.sprint_id,
+        }
+        for item in body.items
+    ]
+
+    try:
+        ml_results = await run_in_threadpool(
+            impact_predictor.predict_all_impacts_batch,
+            items, sprint_context,
+            focus_hours_per_day=focus_hours_per_day,
+            risk_appetite=risk_appetite,
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"ML prediction failed: {exc}")
+
+    results, recommendations = [], []
+    for item, ml_result in zip(items, ml_results):
+        schedule_risk_pct = ml_result.get("schedule_risk", {}).get("probability", 0.0)
+        quality_risk_pct  = ml_result.get("quality_risk",  {}).get("probability", 0.0)
+        velocity_change   = ml_result.get("productivity",  {}).get("velocity_change", 0.0)
+        risk_level_str    = _derive_risk_level_from_ml(schedule_risk_pct, quality_risk_pct)
+        decision = calculate_agile_recommendation(
+            alignment_state = "STRONGLY_ALIGNED",
+            effort_sp       = float(item["story_points"]),
+            free_capacity   = free_capacity,
+            priority        = item["priority"],
+            risk_level      = risk_level_str,
+        )
+        results.append({
+            "title":    item["title"],
+            "display":  ml_result.get("display", {}),
+            "ml_raw": {
+                "effort":        ml_result.get("effort",        {}),
+                "schedule_risk": ml_result.get("schedule_risk", {}),
+                "quality_risk":  ml_result.get("quality_risk",  {}),
+                "productivity":  ml_result.get("productivity",  {}),
+                "summary":       ml_result.get("summary",       {}),
+            },
+            "risk_level": risk_level_str,
+            "decision":   decision.to_dict(),
+        })
+        recommendations.append({
+            "recommendation_type": decision.action,
+            "reasoning":           decision.reasoning,
+            "target_ticket":       None,
+            "impact_analysis": {
+                "schedule_risk":   schedule_risk_pct,
+                "quality_risk":    quality_risk_pct,
+                "velocity_change": velocity_change or 0.0,
+                "days_remaining":  sprint_context["days_remaining"],
+                "free_capacity":   free_capacity,
+            },
+            "action_plan":    {},
+            "work_item_data": item,
+        })
+
+    # Confidence colours for the whole batch come from one vectorised pass
+    for result, explanation in zip(results, explanation_generator.generate_explanations(recommendations)):
+        result["explanation"] = dict(explanation)
+
+    return ORJSONResponse({
+        "sprint_id":   body.sprint_id,
+        "space_id":    space_id,
+        "analysed_at": datetime.utcnow().isoformat(),
+        "results":     results,
+        "sprint_context": {
+            "days_remaining":       sprint_context["days_remaining"],
+            "free_capacity":        round(free_capacity, 1),
+            "historical_velocity":  round(historical_velocity, 1),
+            "focus_hours_per_day":  focus_hours_per_day,
+        },
+    })
 
 
 @router.patch("/logs/{log_id}/feedback")
@@ -13,10 +13,13 @@ Suggests SP based on:
 from database import get_database
 from typing import List, Dict, Optional
 import math
+import re
 
 
 FIBONACCI_SEQUENCE = [1, 2, 3, 5, 8, 13, 21]
 
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
 
 def is_valid_fibonacci(sp: int) -> bool:
     """Check if story points value is a valid Fibonacci number."""
@@ -105,11 +108,8 @@ def calculate_description_complexity(description: str) -> float:
 
 def tokenize_text(text: str) -> List[str]:
     """Simple tokenization: split on whitespace and punctuation."""
-    import re
-    text = text.lower()
     # Remove special characters and split
-    tokens = re.findall(r'\b\w+\b', text)
-    return tokens
+    return _TOKEN_RE.findall(text.lower())
 
 
 def calculate_cosine_similarity(tokens1: List[str], tokens2: List[str]) -> float:
@@ -120,22 +120,12 @@ def calculate_cosine_similarity(tokens1: List[str], tokens2: List[str]) -> float
     if not tokens1 or not tokens2:
         return 0.0
     
-    # Build vectors
-    all_tokens = set(tokens1 + tokens2)
-    vec1 = [1.0 if t in tokens1 else 0.0 for t in all_tokens]
-    vec2 = [1.0 if t in tokens2 else 0.0 for t in all_tokens]
-    
-    # Dot product
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    
-    # Magnitudes
-    mag1 = math.sqrt(sum(a * a for a in vec1))
-    mag2 = math.sqrt(sum(b * b for b in vec2))
-    
-    if mag1 == 0 or mag2 == 0:
-        return 0.0
-    
-    return dot_product / (mag1 * mag2)
+    # Binary bag-of-words vectors: the dot product is the number of shared
+    # unique tokens and each magnitude is sqrt(unique token count), so the
+    # cosine reduces to set arithmetic with no per-token vector building.
+    set1 = set(tokens1)
+    set2 = set(tokens2)
+    return len(set1 & set2) / math.sqrt(len(set1) * len(set2))
 
 
 async def suggest_story_points(
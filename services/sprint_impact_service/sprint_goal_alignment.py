@@ -45,10 +45,12 @@ def detect_critical_blocker(requirement_title: str, requirement_desc: str, prior
 
 # ─── LAYER 2: SEMANTIC SIMILARITY ANALYSIS ───────────────────────────────────
 
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+
 def tokenize_text(text: str) -> List[str]:
-    text = text.lower()
-    text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-    return [w for w in text.split() if w]
+    # str.split() with no argument never yields empty strings
+    return _NON_ALNUM_RE.sub(' ', text.lower()).split()
 
 
 def _jaccard_similarity(goal: str, requirement: str) -> tuple:
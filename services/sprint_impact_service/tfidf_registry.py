@@ -11,6 +11,8 @@ by feature_engineering.py for effort model feature building.
 """
 
 from __future__ import annotations
+import functools
+import math
 import warnings
 import numpy as np
 from typing import Optional
@@ -21,6 +23,19 @@ _standalone_tfidf = None
 def set_standalone_tfidf(vec) -> None:
     global _standalone_tfidf
     _standalone_tfidf = vec
+    _transform_one.cache_clear()   # rows from a previous vectorizer are stale
+
+
+@functools.lru_cache(maxsize=2048)
+def _transform_one(text: str):
+    """
+    Sparse (1, n_features) TF-IDF row for one text, memoised per text.
+    Sprint goals and ticket texts are re-scored repeatedly, so most calls
+    skip tokenisation entirely.  Callers must treat the row as read-only.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return _standalone_tfidf.transform([text])
 
 
 def get_standalone_tfidf():
@@ -58,17 +73,20 @@ def tfidf_cosine_similarity(text_a: str, text_b: str) -> float:
     if _standalone_tfidf is None:
         return -1.0
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            vecs = _standalone_tfidf.transform([text_a, text_b])
-            if hasattr(vecs, 'toarray'):
-                vecs = vecs.toarray()
-            a, b = vecs[0], vecs[1]
-            norm_a = np.linalg.norm(a)
-            norm_b = np.linalg.norm(b)
-            if norm_a == 0 or norm_b == 0:
-                return 0.0
-            return float(np.dot(a, b) / (norm_a * norm_b))
+        a, b = _transform_one(text_a), _transform_one(text_b)
+        if hasattr(a, 'multiply'):
+            # Stay sparse: squared norms from the stored non-zeros only and an
+            # element-wise product over the shared terms, so no
+            # vocabulary-wide dense rows are materialised.
+            sq_a = float(a.data @ a.data)
+            sq_b = float(b.data @ b.data)
+            dot  = float(a.multiply(b).sum()) if sq_a and sq_b else 0.0
+        else:
+            a, b = np.asarray(a)[0], np.asarray(b)[0]
+            sq_a, sq_b, dot = float(a @ a), float(b @ b), float(a @ b)
+        if sq_a == 0 or sq_b == 0:
+            return 0.0
+        return dot / math.sqrt(sq_a * sq_b)
     except Exception as e:
         import sys
         print(f"[TFIDF_REGISTRY] Cosine similarity error: {e}", file=sys.stderr)